@@ -17,7 +17,7 @@ setup(
     author_email="your.email@example.com",
     url="https://github.com/yourusername/bookmark-sync",
     packages=find_packages(),
-    python_requires=">=3.9",
+    python_requires=">=3.10",
     install_requires=[
         # All dependencies are built-in Python modules
     ],
@@ -31,7 +31,6 @@ setup(
         "Intended Audience :: End Users/Desktop",
         "License :: OSI Approved :: MIT License",
         "Programming Language :: Python :: 3",
-        "Programming Language :: Python :: 3.9",
         "Programming Language :: Python :: 3.10",
         "Programming Language :: Python :: 3.11",
         "Topic :: Internet :: WWW/HTTP :: Browsers",
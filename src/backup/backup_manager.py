@@ -1,7 +1,11 @@
 """Backup management for browser bookmarks."""
 
+import errno
 import json
+import os
 import shutil
+import sys
+from collections import defaultdict
 from pathlib import Path
 from datetime import datetime
 from typing import Optional, Dict, List
@@ -9,6 +13,193 @@ from src.utils.logger import setup_logger
 
 logger = setup_logger()
 
+# Buffer size for the read/write fallback; larger buffers stop paying off past ~1 MiB
+COPY_BUFFER_SIZE = 1 << 20
+
+# Errors meaning "this copy mechanism isn't supported here", as opposed to real I/O failures
+_COPY_UNSUPPORTED_ERRNOS = {
+    errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP,
+    getattr(errno, "ENOTSUP", errno.EOPNOTSUPP), getattr(errno, "ENOTSOCK", errno.EINVAL),
+}
+
+
+# Linux ioctl that shares the source's extents with the destination (Btrfs, XFS, ...)
+_FICLONE = 0x40049409
+
+
+def _try_reflink(src_fd: int, dst_fd: int) -> bool:
+    """
+    Try a copy-on-write clone of src_fd into dst_fd (Linux only).
+    
+    Returns:
+        True if the destination now shares the source's data blocks
+    """
+    if not sys.platform.startswith("linux"):
+        return False
+    try:
+        import fcntl
+        fcntl.ioctl(dst_fd, _FICLONE, src_fd)
+        return True
+    except (ImportError, OSError):
+        # Filesystem without reflink support, or source/dest on different filesystems
+        return False
+
+
+def _try_clonefile(src: Path, dst: Path) -> bool:
+    """
+    Try an APFS clone of src to dst via clonefile(2) (macOS only).
+    
+    clonefile refuses to overwrite, so this only applies to new destinations.
+    
+    Returns:
+        True if dst was created as a clone of src
+    """
+    if sys.platform != "darwin" or os.path.lexists(dst):
+        return False
+    try:
+        import ctypes
+        libc = ctypes.CDLL("libSystem.dylib", use_errno=True)
+        return libc.clonefile(os.fsencode(src), os.fsencode(dst), 0) == 0
+    except (OSError, AttributeError):
+        return False
+
+
+def _kernel_copy(copy_fn, offset: int, size: int) -> int:
+    """
+    Drive an in-kernel copy function until the source is drained.
+    
+    Args:
+        copy_fn: Callable(offset, count) -> bytes copied
+        offset: Offset to start copying from
+        size: Total size of the source file
+        
+    Returns:
+        Offset reached (equals size unless the mechanism is unsupported)
+    """
+    while offset < size:
+        try:
+            copied = copy_fn(offset, size - offset)
+        except OSError as e:
+            if e.errno in _COPY_UNSUPPORTED_ERRNOS:
+                return offset
+            raise
+        if copied == 0:
+            # Source shrank underneath us
+            break
+        offset += copied
+    return offset
+
+
+def _buffered_copy(src_fd: int, dst_fd: int):
+    """
+    Copy the rest of src_fd into dst_fd through a single reusable buffer.
+    
+    Args:
+        src_fd: Source file descriptor, positioned at the read offset
+        dst_fd: Destination file descriptor, positioned at the write offset
+    """
+    buf = memoryview(bytearray(COPY_BUFFER_SIZE))
+    with open(src_fd, 'rb', buffering=0, closefd=False) as fsrc, \
+            open(dst_fd, 'wb', buffering=0, closefd=False) as fdst:
+        while True:
+            n = fsrc.readinto(buf)
+            if not n:
+                break
+            view = buf[:n]
+            while view:
+                view = view[fdst.write(view):]
+
+
+def _copy_contents(src: Path, dst: Path):
+    """
+    Copy file data from src into a new file at dst.
+    
+    Tries a copy-on-write clone first (FICLONE on Linux, clonefile on macOS),
+    then os.copy_file_range (server-side copies on NFS), then os.sendfile,
+    then a plain read/write loop.
+    
+    Args:
+        src: Source file
+        dst: Destination file
+    """
+    if _try_clonefile(src, dst):
+        return
+    
+    binary = getattr(os, "O_BINARY", 0)
+    src_fd = os.open(src, os.O_RDONLY | binary)
+    try:
+        dst_fd = os.open(dst, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | binary, 0o644)
+        try:
+            size = os.fstat(src_fd).st_size
+            offset = size if _try_reflink(src_fd, dst_fd) else 0
+            
+            if offset < size and hasattr(os, "copy_file_range"):
+                offset = _kernel_copy(
+                    lambda off, count: os.copy_file_range(src_fd, dst_fd, count, off, off),
+                    offset, size
+                )
+            
+            if offset < size and hasattr(os, "sendfile"):
+                os.lseek(dst_fd, offset, os.SEEK_SET)
+                offset = _kernel_copy(
+                    lambda off, count: os.sendfile(dst_fd, src_fd, off, count),
+                    offset, size
+                )
+            
+            if offset < size:
+                os.lseek(src_fd, offset, os.SEEK_SET)
+                os.lseek(dst_fd, offset, os.SEEK_SET)
+                _buffered_copy(src_fd, dst_fd)
+        finally:
+            os.close(dst_fd)
+    finally:
+        os.close(src_fd)
+
+
+def _fast_copy(src: Path, dst: Path):
+    """
+    Copy a file and its metadata, like shutil.copy2.
+    
+    The data goes to a temp file next to dst which is then os.replace()d
+    over it, so dst always ends up as a new inode. That keeps any hard link
+    to the old dst (see BackupManager.backup_*(link=True)) intact.
+    
+    Args:
+        src: Source file
+        dst: Destination file
+    """
+    dst = Path(dst)
+    tmp = dst.with_name(dst.name + ".tmp")
+    try:
+        _copy_contents(src, tmp)
+        shutil.copystat(src, tmp)
+        os.replace(tmp, dst)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+
+
+def _link_or_copy(src: Path, dst: Path, link: bool):
+    """
+    Hard-link src to dst when requested and possible, otherwise copy it.
+    
+    Args:
+        src: Source file
+        dst: Destination file
+        link: Try os.link first (falls back to copying across filesystems)
+    """
+    if link:
+        try:
+            os.link(src, dst)
+            return
+        except OSError:
+            # Different filesystem (EXDEV), or links unsupported/not permitted
+            pass
+    _fast_copy(src, dst)
+
 
 class BackupManager:
     """Manages backups of browser bookmark files."""
@@ -22,34 +213,90 @@ class BackupManager:
         """
         self.backup_dir = Path(backup_dir)
         self.backup_dir.mkdir(parents=True, exist_ok=True)
-        self.metadata_file = self.backup_dir / "metadata.json"
-        self._load_metadata()
+        # Append-only log: one JSON record per line, rewritten only on cleanup
+        self.metadata_file = self.backup_dir / "metadata.jsonl"
+        self.legacy_metadata_file = self.backup_dir / "metadata.json"
+        self._metadata = self._load_metadata()
+        self._by_source: Dict[str, List[Dict]] = defaultdict(list)
+        self._rebuild_source_index()
+    
+    def _rebuild_source_index(self):
+        """Rebuild the source -> backups index from the cached metadata."""
+        self._by_source.clear()
+        for backup in self._metadata.get("backups", []):
+            self._by_source[backup.get("source")].append(backup)
     
     def _load_metadata(self) -> Dict:
         """Load backup metadata."""
         if self.metadata_file.exists():
+            backups = []
             try:
                 with open(self.metadata_file, 'r') as f:
-                    return json.load(f)
+                    for line in f:
+                        if not line.strip():
+                            continue
+                        try:
+                            backups.append(self._with_epoch(json.loads(line)))
+                        except ValueError as e:
+                            # Most likely a torn write from an interrupted append
+                            logger.warning(f"Skipping corrupt backup metadata record: {e}")
+            except Exception as e:
+                logger.warning(f"Failed to load backup metadata: {e}")
+            return {"backups": backups}
+        
+        if self.legacy_metadata_file.exists():
+            # Migrate the old single-document metadata.json
+            try:
+                with open(self.legacy_metadata_file, 'r') as f:
+                    metadata = json.load(f)
+                metadata["backups"] = [self._with_epoch(b) for b in metadata.get("backups", [])]
+                self._save_metadata(metadata)
+                return metadata
             except Exception as e:
                 logger.warning(f"Failed to load backup metadata: {e}")
         return {"backups": []}
     
+    @staticmethod
+    def _with_epoch(record: Dict) -> Dict:
+        """Backfill the numeric ts_epoch field on records written before it existed."""
+        if "ts_epoch" not in record:
+            try:
+                record["ts_epoch"] = datetime.fromisoformat(record["timestamp"]).timestamp()
+            except (KeyError, TypeError, ValueError):
+                # Left unset; cleanup keeps records it can't date
+                pass
+        return record
+    
+    def _append_metadata(self, record: Dict):
+        """Append a single backup record to the metadata log."""
+        try:
+            with open(self.metadata_file, 'a') as f:
+                f.write(json.dumps(record, default=str) + '\n')
+        except Exception as e:
+            logger.error(f"Failed to save backup metadata: {e}")
+    
     def _save_metadata(self, metadata: Dict):
-        """Save backup metadata."""
+        """Rewrite (compact) the metadata log atomically."""
+        tmp_file = self.metadata_file.with_suffix(".jsonl.tmp")
         try:
-            with open(self.metadata_file, 'w') as f:
-                json.dump(metadata, f, indent=2, default=str)
+            with open(tmp_file, 'w') as f:
+                for record in metadata.get("backups", []):
+                    f.write(json.dumps(record, default=str) + '\n')
+            os.replace(tmp_file, self.metadata_file)
         except Exception as e:
             logger.error(f"Failed to save backup metadata: {e}")
     
-    def backup_firefox(self, profile_path: Path, profile_name: str = "default") -> Optional[Path]:
+    def backup_firefox(self, profile_path: Path, profile_name: str = "default",
+                   link: bool = False) -> Optional[Path]:
         """
         Backup Firefox places.sqlite database.
         
         Args:
             profile_path: Path to Firefox profile directory
             profile_name: Name of the profile
+            link: Hard-link instead of copying when on the same filesystem. Only
+                safe when the live file is about to be replaced by a new inode,
+                as on restore.
             
         Returns:
             Path to backup file or None if failed
@@ -59,25 +306,28 @@ class BackupManager:
             logger.error(f"Firefox places.sqlite not found at {places_db}")
             return None
         
-        timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+        now = datetime.now()
+        timestamp = now.strftime("%Y-%m-%d_%H-%M-%S")
         backup_filename = f"firefox_{profile_name}_places_{timestamp}.sqlite"
         backup_path = self.backup_dir / "firefox" / backup_filename
         
         try:
             backup_path.parent.mkdir(parents=True, exist_ok=True)
-            shutil.copy2(places_db, backup_path)
+            _link_or_copy(places_db, backup_path, link)
             
             # Update metadata
-            metadata = self._load_metadata()
-            metadata["backups"].append({
-                "timestamp": datetime.now().isoformat(),
+            record = {
+                "timestamp": now.isoformat(),
+                "ts_epoch": now.timestamp(),
                 "source": "firefox",
                 "profile": profile_name,
                 "file": backup_filename,
                 "path": str(backup_path),
                 "size": backup_path.stat().st_size
-            })
-            self._save_metadata(metadata)
+            }
+            self._metadata["backups"].append(record)
+            self._by_source[record["source"]].append(record)
+            self._append_metadata(record)
             
             logger.info(f"Backed up Firefox profile '{profile_name}' to {backup_path}")
             return backup_path
@@ -85,13 +335,17 @@ class BackupManager:
             logger.error(f"Failed to backup Firefox: {e}")
             return None
     
-    def backup_chrome(self, profile_path: Path, profile_name: str = "Default") -> Optional[Path]:
+    def backup_chrome(self, profile_path: Path, profile_name: str = "Default",
+                   link: bool = False) -> Optional[Path]:
         """
         Backup Chrome Bookmarks file.
         
         Args:
             profile_path: Path to Chrome profile directory
             profile_name: Name of the profile
+            link: Hard-link instead of copying when on the same filesystem. Only
+                safe when the live file is about to be replaced by a new inode,
+                as on restore.
             
         Returns:
             Path to backup file or None if failed
@@ -101,25 +355,28 @@ class BackupManager:
             logger.error(f"Chrome Bookmarks file not found at {bookmarks_file}")
             return None
         
-        timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+        now = datetime.now()
+        timestamp = now.strftime("%Y-%m-%d_%H-%M-%S")
         backup_filename = f"chrome_{profile_name}_Bookmarks_{timestamp}.json"
         backup_path = self.backup_dir / "chrome" / backup_filename
         
         try:
             backup_path.parent.mkdir(parents=True, exist_ok=True)
-            shutil.copy2(bookmarks_file, backup_path)
+            _link_or_copy(bookmarks_file, backup_path, link)
             
             # Update metadata
-            metadata = self._load_metadata()
-            metadata["backups"].append({
-                "timestamp": datetime.now().isoformat(),
+            record = {
+                "timestamp": now.isoformat(),
+                "ts_epoch": now.timestamp(),
                 "source": "chrome",
                 "profile": profile_name,
                 "file": backup_filename,
                 "path": str(backup_path),
                 "size": backup_path.stat().st_size
-            })
-            self._save_metadata(metadata)
+            }
+            self._metadata["backups"].append(record)
+            self._by_source[record["source"]].append(record)
+            self._append_metadata(record)
             
             logger.info(f"Backed up Chrome profile '{profile_name}' to {backup_path}")
             return backup_path
@@ -127,25 +384,44 @@ class BackupManager:
             logger.error(f"Failed to backup Chrome: {e}")
             return None
     
-    def list_backups(self, source: Optional[str] = None) -> List[Dict]:
+    def list_backups(self, source: Optional[str] = None, limit: Optional[int] = None,
+                     offset: int = 0) -> List[Dict]:
         """
-        List all backups, optionally filtered by source.
+        List backups newest first, optionally filtered by source.
         
         Args:
             source: Filter by source ('firefox' or 'chrome')
+            limit: Maximum number of backups to return (None for all)
+            offset: Number of newest backups to skip
             
         Returns:
             List of backup metadata dicts
         """
-        metadata = self._load_metadata()
-        backups = metadata.get("backups", [])
-        
         if source:
-            backups = [b for b in backups if b.get("source") == source]
+            backups = self._by_source.get(source, [])
+        else:
+            backups = self._metadata.get("backups", [])
+        
+        # Sort the cached list in place (newest first); it stays nearly sorted
+        # between calls, so this is close to a linear pass
+        backups.sort(key=lambda x: x.get("ts_epoch", 0.0), reverse=True)
+        if limit is None:
+            return backups[offset:]
+        return backups[offset:offset + limit]
+    
+    def count_backups(self, source: Optional[str] = None) -> int:
+        """
+        Count backups without listing them.
         
-        # Sort by timestamp (newest first)
-        backups.sort(key=lambda x: x.get("timestamp", ""), reverse=True)
-        return backups
+        Args:
+            source: Filter by source ('firefox' or 'chrome')
+            
+        Returns:
+            Number of backups
+        """
+        if source:
+            return len(self._by_source.get(source, []))
+        return len(self._metadata.get("backups", []))
     
     def get_latest_backup(self, source: str) -> Optional[Dict]:
         """
@@ -157,8 +433,11 @@ class BackupManager:
         Returns:
             Latest backup metadata dict or None
         """
-        backups = self.list_backups(source)
-        return backups[0] if backups else None
+        return max(
+            self._by_source.get(source, ()),
+            key=lambda b: b.get("ts_epoch", 0.0),
+            default=None
+        )
     
     def cleanup_old_backups(self, retention_days: int = 30):
         """
@@ -167,8 +446,10 @@ class BackupManager:
         Args:
             retention_days: Number of days to keep backups
         """
-        metadata = self._load_metadata()
-        backups = metadata.get("backups", [])
+        # Compact from the log as it is now, not this instance's cached copy:
+        # other BackupManager instances may have appended records since we loaded
+        self._metadata = self._load_metadata()
+        backups = self._metadata.get("backups", [])
         cutoff_date = datetime.now().timestamp() - (retention_days * 24 * 60 * 60)
         
         kept_backups = []
@@ -176,10 +457,9 @@ class BackupManager:
         
         for backup in backups:
             try:
-                backup_time = datetime.fromisoformat(backup["timestamp"]).timestamp()
                 backup_path = Path(backup["path"])
                 
-                if backup_time < cutoff_date:
+                if backup["ts_epoch"] < cutoff_date:
                     # Remove old backup
                     if backup_path.exists():
                         backup_path.unlink()
@@ -191,8 +471,9 @@ class BackupManager:
                 # Keep backup if we can't process it
                 kept_backups.append(backup)
         
-        metadata["backups"] = kept_backups
-        self._save_metadata(metadata)
+        self._metadata["backups"] = kept_backups
+        self._rebuild_source_index()
+        self._save_metadata(self._metadata)
         
         if removed_count > 0:
             logger.info(f"Cleaned up {removed_count} old backup(s)")
@@ -1,10 +1,9 @@
 """Restore functionality for backups."""
 
-import shutil
 from pathlib import Path
 from typing import Optional
 from src.utils.logger import setup_logger
-from src.backup.backup_manager import BackupManager
+from src.backup.backup_manager import BackupManager, _fast_copy
 
 logger = setup_logger()
 
@@ -40,15 +39,24 @@ class RestoreManager:
         
         try:
             # Create backup of current state before restoring
+            # The live file is about to be replaced by a new inode, so a hard
+            # link is a safe (and instant) snapshot of it
             current_backup = self.backup_manager.backup_firefox(
                 profile_path,
-                profile_path.name
+                profile_path.name,
+                link=True
             )
             if current_backup:
                 logger.info(f"Created backup of current state: {current_backup}")
             
             # Restore from backup
-            shutil.copy2(backup_path, places_db)
+            try:
+                _fast_copy(backup_path, places_db)
+            except Exception:
+                if current_backup:
+                    # The live file wasn't replaced; detach the snapshot from it
+                    _fast_copy(places_db, current_backup)
+                raise
             logger.info(f"Restored Firefox from {backup_path}")
             return True
         except Exception as e:
@@ -74,15 +82,24 @@ class RestoreManager:
         
         try:
             # Create backup of current state before restoring
+            # The live file is about to be replaced by a new inode, so a hard
+            # link is a safe (and instant) snapshot of it
             current_backup = self.backup_manager.backup_chrome(
                 profile_path,
-                profile_path.name
+                profile_path.name,
+                link=True
             )
             if current_backup:
                 logger.info(f"Created backup of current state: {current_backup}")
             
             # Restore from backup
-            shutil.copy2(backup_path, bookmarks_file)
+            try:
+                _fast_copy(backup_path, bookmarks_file)
+            except Exception:
+                if current_backup:
+                    # The live file wasn't replaced; detach the snapshot from it
+                    _fast_copy(bookmarks_file, current_backup)
+                raise
             logger.info(f"Restored Chrome from {backup_path}")
             return True
         except Exception as e:
@@ -1,14 +1,16 @@
 """Chrome browser adapter."""
 
-import json
+import os
+import shutil
 from pathlib import Path
 from datetime import datetime
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Iterator, List, Tuple
 from src.browsers.base import BrowserAdapter
 from src.core.models import BookmarkTree, BookmarkFolder, Bookmark
 from src.utils.paths import get_chrome_profile_path, get_chrome_bookmarks_file, is_chrome_locked
 from src.utils.logger import setup_logger
 from src.utils.validators import is_valid_url
+from src.utils import json_io
 
 logger = setup_logger()
 
@@ -40,73 +42,80 @@ class ChromeAdapter(BrowserAdapter):
         """Check if Chrome Bookmarks file is locked."""
         return is_chrome_locked(self.profile_name)
     
-    def _timestamp_to_datetime(self, timestamp) -> datetime:
+    def _timestamp_to_datetime(self, timestamp, _from_timestamp=datetime.fromtimestamp) -> datetime:
         """Convert Chrome timestamp (microseconds since epoch) to datetime."""
-        # Chrome uses microseconds since Unix epoch
-        # Handle both string and int timestamps (Chrome sometimes stores as strings)
-        if isinstance(timestamp, str):
-            timestamp = int(timestamp) if timestamp else 0
-        elif timestamp is None:
-            timestamp = 0
-        elif not isinstance(timestamp, (int, float)):
-            # Try to convert to int
-            try:
-                timestamp = int(timestamp)
-            except (ValueError, TypeError):
-                timestamp = 0
-        return datetime.fromtimestamp(timestamp / 1000000)
+        # Chrome usually stores timestamps as digit strings; int() covers str, int and
+        # float alike, and anything unparseable ("", None, garbage) maps to the epoch
+        try:
+            return _from_timestamp(int(timestamp) / 1000000)
+        except (TypeError, ValueError):
+            return _from_timestamp(0)
     
     def _datetime_to_timestamp(self, dt: datetime) -> int:
         """Convert datetime to Chrome timestamp (microseconds)."""
         return int(dt.timestamp() * 1000000)
     
-    def _parse_chrome_node(self, node: Dict[str, Any], parent_folder: BookmarkFolder):
+    def _parse_chrome_children(self, children: List[Dict[str, Any]], parent_folder: BookmarkFolder):
         """
-        Recursively parse a Chrome bookmark node.
+        Parse a list of Chrome bookmark nodes into parent_folder.
+        
+        Walks the subtree with an explicit stack rather than recursion, so
+        deeply nested folders can't hit the recursion limit.
         
         Args:
-            node: Chrome bookmark node dict
+            children: Chrome bookmark node dicts
             parent_folder: Parent BookmarkFolder to add items to
         """
-        node_type = node.get("type", "folder")
-        name = node.get("name", "")
+        convert = self._timestamp_to_datetime
+        valid_url = is_valid_url
         
-        if node_type == "url":
-            url = node.get("url", "")
-            if not is_valid_url(url):
-                return
-            
-            date_added_raw = node.get("date_added", "0")
-            date_modified_raw = node.get("date_modified", date_added_raw)
-            date_added = self._timestamp_to_datetime(date_added_raw)
-            date_modified = self._timestamp_to_datetime(date_modified_raw)
-            
-            bookmark = Bookmark(
-                title=name or url,
-                url=url,
-                date_added=date_added,
-                date_modified=date_modified
-            )
-            parent_folder.add_child(bookmark)
+        # date_modified usually repeats date_added (or is "0"), so memoize by raw
+        # value; datetimes are immutable and safe to share between nodes
+        converted: Dict[Any, datetime] = {}
         
-        elif node_type == "folder":
-            date_added_raw = node.get("date_added", "0")
-            date_modified_raw = node.get("date_modified", date_added_raw)
-            date_added = self._timestamp_to_datetime(date_added_raw)
-            date_modified = self._timestamp_to_datetime(date_modified_raw)
-            
-            folder = BookmarkFolder(
-                name=name or "Unnamed Folder",
-                date_added=date_added,
-                date_modified=date_modified
-            )
+        def to_datetime(raw):
+            try:
+                return converted[raw]
+            except KeyError:
+                value = converted[raw] = convert(raw)
+                return value
+            except TypeError:
+                return convert(raw)
+        
+        # Children are pushed in reverse so they pop (and are added) in order
+        stack = [(child, parent_folder) for child in reversed(children)]
+        while stack:
+            node, parent = stack.pop()
+            node_type = node.get("type", "folder")
+            name = node.get("name", "")
             
-            # Process children
-            children = node.get("children", [])
-            for child in children:
-                self._parse_chrome_node(child, folder)
+            if node_type == "url":
+                url = node.get("url", "")
+                if not valid_url(url):
+                    continue
+                
+                date_added_raw = node.get("date_added", "0")
+                date_modified_raw = node.get("date_modified", date_added_raw)
+                
+                parent.add_child(Bookmark(
+                    title=name or url,
+                    url=url,
+                    date_added=to_datetime(date_added_raw),
+                    date_modified=to_datetime(date_modified_raw)
+                ))
             
-            parent_folder.add_child(folder)
+            elif node_type == "folder":
+                date_added_raw = node.get("date_added", "0")
+                date_modified_raw = node.get("date_modified", date_added_raw)
+                
+                folder = BookmarkFolder(
+                    name=name or "Unnamed Folder",
+                    date_added=to_datetime(date_added_raw),
+                    date_modified=to_datetime(date_modified_raw)
+                )
+                parent.add_child(folder)
+                
+                stack.extend((child, folder) for child in reversed(node.get("children", [])))
     
     def read_bookmarks(self) -> BookmarkTree:
         """
@@ -119,8 +128,7 @@ class ChromeAdapter(BrowserAdapter):
             raise RuntimeError("Chrome Bookmarks file is locked. Please close Chrome and try again.")
         
         try:
-            with open(self.bookmarks_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            data = json_io.loads(self.bookmarks_file.read_bytes())
         except Exception as e:
             raise RuntimeError(f"Failed to read Chrome Bookmarks file: {e}")
         
@@ -145,9 +153,7 @@ class ChromeAdapter(BrowserAdapter):
                     date_modified=datetime.now()
                 )
                 
-                children = root_node.get("children", [])
-                for child in children:
-                    self._parse_chrome_node(child, folder)
+                self._parse_chrome_children(root_node.get("children", []), folder)
                 
                 if folder.children:
                     root.add_child(folder)
@@ -155,6 +161,51 @@ class ChromeAdapter(BrowserAdapter):
         logger.info(f"Read {len(root.get_all_bookmarks())} bookmarks from Chrome")
         return root
     
+    def iter_bookmark_fields(self) -> Iterator[Tuple[str, str, datetime]]:
+        """
+        Iterate over (url, title, date_modified) of every bookmark, in the
+        order read_bookmarks would produce them, without building a tree.
+        
+        Yields:
+            Tuple of (url, title, date_modified) per valid bookmark
+        """
+        if self.is_locked():
+            raise RuntimeError("Chrome Bookmarks file is locked. Please close Chrome and try again.")
+        
+        try:
+            data = json_io.loads(self.bookmarks_file.read_bytes())
+        except Exception as e:
+            raise RuntimeError(f"Failed to read Chrome Bookmarks file: {e}")
+        
+        convert = self._timestamp_to_datetime
+        valid_url = is_valid_url
+        converted: Dict[Any, datetime] = {}
+        
+        roots = data.get("roots", {})
+        stack = []
+        for root_name in ["synced", "other", "bookmark_bar"]:
+            if root_name in roots:
+                stack.extend(reversed(roots[root_name].get("children", [])))
+        
+        while stack:
+            node = stack.pop()
+            node_type = node.get("type", "folder")
+            if node_type == "url":
+                url = node.get("url", "")
+                if not valid_url(url):
+                    continue
+                
+                raw = node.get("date_modified", node.get("date_added", "0"))
+                try:
+                    date_modified = converted[raw]
+                except KeyError:
+                    date_modified = converted[raw] = convert(raw)
+                except TypeError:
+                    date_modified = convert(raw)
+                yield url, node.get("name", "") or url, date_modified
+            elif node_type == "folder":
+                stack.extend(reversed(node.get("children", [])))
+    
     def _bookmark_to_chrome_node(self, bookmark: Bookmark) -> Dict[str, Any]:
         """Convert Bookmark to Chrome node format."""
         return {
@@ -166,21 +217,38 @@ class ChromeAdapter(BrowserAdapter):
         }
     
     def _folder_to_chrome_node(self, folder: BookmarkFolder) -> Dict[str, Any]:
-        """Convert BookmarkFolder to Chrome node format."""
-        children = []
-        for child in folder.children:
-            if isinstance(child, Bookmark):
-                children.append(self._bookmark_to_chrome_node(child))
-            elif isinstance(child, BookmarkFolder):
-                children.append(self._folder_to_chrome_node(child))
+        """
+        Convert BookmarkFolder to Chrome node format.
         
-        return {
-            "name": folder.name,
-            "type": "folder",
-            "date_added": str(self._datetime_to_timestamp(folder.date_added)),
-            "date_modified": str(self._datetime_to_timestamp(folder.date_modified)),
-            "children": children
-        }
+        Builds the subtree with an explicit stack rather than recursion.
+        """
+        to_timestamp = self._datetime_to_timestamp
+        bookmark_node = self._bookmark_to_chrome_node
+        
+        def folder_node(item: BookmarkFolder) -> Dict[str, Any]:
+            return {
+                "name": item.name,
+                "type": "folder",
+                "date_added": str(to_timestamp(item.date_added)),
+                "date_modified": str(to_timestamp(item.date_modified)),
+                "children": []
+            }
+        
+        root_node = folder_node(folder)
+        # Each entry pairs a source folder with the (already attached) list its children go into
+        stack = [(folder, root_node["children"])]
+        while stack:
+            source, children = stack.pop()
+            for child in source.children:
+                kind = child.kind
+                if kind == "url":
+                    children.append(bookmark_node(child))
+                elif kind == "folder":
+                    node = folder_node(child)
+                    children.append(node)
+                    stack.append((child, node["children"]))
+        
+        return root_node
     
     def write_bookmarks(self, tree: BookmarkTree) -> bool:
         """
@@ -196,37 +264,31 @@ class ChromeAdapter(BrowserAdapter):
             raise RuntimeError("Chrome Bookmarks file is locked. Please close Chrome and try again.")
         
         try:
-            # Read existing file to preserve metadata
-            try:
-                with open(self.bookmarks_file, 'r', encoding='utf-8') as f:
-                    existing_data = json.load(f)
-            except:
-                existing_data = {}
-            
             # Create new structure
+            now_timestamp = str(self._datetime_to_timestamp(datetime.now()))
             chrome_data = {
                 "checksum": "",
                 "roots": {
                     "bookmark_bar": {
                         "children": [],
-                        "date_added": str(self._datetime_to_timestamp(datetime.now())),
-                        "date_modified": str(self._datetime_to_timestamp(datetime.now())),
+                        "date_added": now_timestamp,
+                        "date_modified": now_timestamp,
                         "id": "1",
                         "name": "Bookmarks Bar",
                         "type": "folder"
                     },
                     "other": {
                         "children": [],
-                        "date_added": str(self._datetime_to_timestamp(datetime.now())),
-                        "date_modified": str(self._datetime_to_timestamp(datetime.now())),
+                        "date_added": now_timestamp,
+                        "date_modified": now_timestamp,
                         "id": "2",
                         "name": "Other Bookmarks",
                         "type": "folder"
                     },
                     "synced": {
                         "children": [],
-                        "date_added": str(self._datetime_to_timestamp(datetime.now())),
-                        "date_modified": str(self._datetime_to_timestamp(datetime.now())),
+                        "date_added": now_timestamp,
+                        "date_modified": now_timestamp,
                         "id": "3",
                         "name": "Mobile Bookmarks",
                         "type": "folder"
@@ -241,22 +303,30 @@ class ChromeAdapter(BrowserAdapter):
             other_children = []
             
             for child in tree.children:
-                if isinstance(child, BookmarkFolder):
+                if child.kind == "folder":
                     chrome_node = self._folder_to_chrome_node(child)
                     # Put in bookmark_bar by default, or other if it's a special folder
                     if child.name.lower() in ["other", "other bookmarks"]:
                         other_children.append(chrome_node)
                     else:
                         bookmark_bar_children.append(chrome_node)
-                elif isinstance(child, Bookmark):
+                elif child.kind == "url":
                     bookmark_bar_children.append(self._bookmark_to_chrome_node(child))
             
             chrome_data["roots"]["bookmark_bar"]["children"] = bookmark_bar_children
             chrome_data["roots"]["other"]["children"] = other_children
             
-            # Write to file
-            with open(self.bookmarks_file, 'w', encoding='utf-8') as f:
-                json.dump(chrome_data, f, indent=2, ensure_ascii=False)
+            # Serialize fully, write to a sibling temp file and atomically swap it in,
+            # so a crash mid-write never leaves Chrome with a truncated Bookmarks file
+            payload = json_io.dumps(chrome_data)
+            tmp_file = self.bookmarks_file.with_suffix(".tmp")
+            with open(tmp_file, 'wb') as f:
+                f.write(payload)
+                f.flush()
+                os.fsync(f.fileno())
+            if self.bookmarks_file.exists():
+                shutil.copymode(self.bookmarks_file, tmp_file)
+            os.replace(tmp_file, self.bookmarks_file)
             
             logger.info(f"Wrote {len(tree.get_all_bookmarks())} bookmarks to Chrome")
             return True
@@ -1,9 +1,13 @@
 """Firefox browser adapter."""
 
+import base64
+import json
+import os
 import sqlite3
-import uuid
 from pathlib import Path
 from datetime import datetime
+from functools import lru_cache
+from urllib.parse import urlsplit
 from typing import Optional, Dict, List, Tuple
 from src.browsers.base import BrowserAdapter
 from src.core.models import BookmarkTree, BookmarkFolder, Bookmark
@@ -13,6 +17,44 @@ from src.utils.validators import is_valid_url
 
 logger = setup_logger()
 
+# Write-path statements. Keeping each as one module-level string means every
+# execute/executemany passes the identical SQL text, so sqlite3's statement
+# cache reuses the prepared statement instead of re-parsing it.
+_SQL_MAX_BOOKMARK_ID = "SELECT COALESCE(MAX(id), 0) FROM moz_bookmarks"
+_SQL_MAX_PLACE_ID = "SELECT COALESCE(MAX(id), 0) FROM moz_places"
+_SQL_SELECT_PLACES = """
+    SELECT url, MIN(id) FROM moz_places
+    WHERE url IN (SELECT value FROM json_each(?))
+    GROUP BY url
+"""
+_SQL_UPDATE_PLACE_TITLE = "UPDATE moz_places SET title = ? WHERE id = ?"
+_SQL_INSERT_PLACE = """
+    INSERT INTO moz_places (id, url, title, rev_host, visit_count, hidden, typed, frecency, last_visit_date)
+    VALUES (?, ?, ?, ?, 0, 0, 0, 0, ?)
+"""
+_SQL_INSERT_FOLDER = """
+    INSERT INTO moz_bookmarks
+    (id, type, parent, position, title, dateAdded, lastModified, guid)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+"""
+_SQL_INSERT_BOOKMARK = """
+    INSERT INTO moz_bookmarks
+    (id, type, fk, parent, position, title, dateAdded, lastModified, guid)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+
+@lru_cache(maxsize=4096)
+def _datetime_to_us(dt: datetime, fold: int) -> int:
+    """
+    Convert datetime to Firefox timestamp (microseconds), memoized.
+    
+    Bookmarks imported together often share timestamps. fold is part of the
+    cache key because naive datetimes that differ only in fold compare equal
+    but map to different instants during a DST transition.
+    """
+    return int(dt.timestamp() * 1000000)
+
 
 class FirefoxAdapter(BrowserAdapter):
     """Adapter for reading and writing Firefox bookmarks."""
@@ -28,6 +70,18 @@ class FirefoxAdapter(BrowserAdapter):
     ROOT_UNFILED = 4
     ROOT_MOBILE = 5
     
+    # Applied to every connection opened by this adapter
+    CONNECTION_PRAGMAS = (
+        "journal_mode=WAL",
+        "synchronous=NORMAL",
+        "temp_store=MEMORY",
+        "cache_size=-20000",
+        "mmap_size=268435456",
+    )
+    
+    # places.sqlite path -> moz_bookmarks column names, probed once per process
+    _columns_cache: Dict[Path, frozenset] = {}
+    
     def __init__(self, profile_name: Optional[str] = None):
         """
         Initialize Firefox adapter.
@@ -59,62 +113,90 @@ class FirefoxAdapter(BrowserAdapter):
     
     def _datetime_to_timestamp(self, dt: datetime) -> int:
         """Convert datetime to Firefox timestamp (microseconds)."""
-        return int(dt.timestamp() * 1000000)
+        return _datetime_to_us(dt, dt.fold)
     
-    def _generate_guid(self) -> str:
+    def _generate_guids(self, count: int) -> List[str]:
         """
-        Generate a Firefox-style GUID.
-        Firefox uses 12-byte GUIDs in a specific format.
-        Format: {8hex-4hex-4hex-4hex-12hex}
+        Generate Firefox-style GUIDs.
+        Firefox GUIDs are 12 URL-safe base64 characters (9 random bytes),
+        the same shape secrets.token_urlsafe(9) produces.
+        
+        Args:
+            count: Number of GUIDs to generate
+            
+        Returns:
+            List of GUID strings
         """
-        guid = uuid.uuid4()
-        return str(guid)
+        # One urandom call for the batch; 9 bytes encode to exactly 12
+        # characters with no padding, so the encoded buffer slices evenly
+        encoded = base64.urlsafe_b64encode(os.urandom(9 * count)).decode("ascii")
+        return [encoded[i:i + 12] for i in range(0, 12 * count, 12)]
     
-    def _get_or_create_place(self, conn: sqlite3.Connection, url: str, title: str) -> int:
+    def _get_or_create_places(self, cursor: sqlite3.Cursor, titles: Dict[str, str]) -> Dict[str, int]:
         """
-        Get existing place_id or create new entry in moz_places.
+        Resolve place ids for many URLs at once, creating missing moz_places rows.
+        
+        moz_places has no unique constraint on url, so existing rows are looked
+        up with a single query and only the missing URLs are inserted.
         
         Args:
-            conn: Database connection
-            url: URL to look up or create
-            title: Title for the URL
+            cursor: Cursor of the write transaction
+            titles: Mapping of URL to the title to store for it
             
         Returns:
-            place_id (integer)
+            Mapping of URL to place_id
         """
-        cursor = conn.cursor()
+        cursor.execute(_SQL_SELECT_PLACES, (json.dumps(list(titles)),))
+        place_ids = dict(cursor.fetchall())
         
-        # Check if URL already exists
-        cursor.execute("SELECT id FROM moz_places WHERE url = ?", (url,))
-        row = cursor.fetchone()
+        # Update titles of existing places when a title is provided
+        cursor.executemany(
+            _SQL_UPDATE_PLACE_TITLE,
+            [(titles[url], place_id) for url, place_id in place_ids.items() if titles[url]]
+        )
         
-        if row:
-            place_id = row[0]
-            # Update title if provided and different
-            if title:
-                cursor.execute("UPDATE moz_places SET title = ? WHERE id = ?", (title, place_id))
-            return place_id
-        
-        # Create new place entry
+        # Create new place entries
+        cursor.execute(_SQL_MAX_PLACE_ID)
+        next_id = cursor.fetchone()[0] + 1
         now = self._datetime_to_timestamp(datetime.now())
-        cursor.execute("""
-            INSERT INTO moz_places (url, title, rev_host, visit_count, hidden, typed, frecency, last_visit_date)
-            VALUES (?, ?, ?, 0, 0, 0, 0, ?)
-        """, (url, title, self._reverse_host(url), now))
+        new_rows = []
+        for url, title in titles.items():
+            if url not in place_ids:
+                place_ids[url] = next_id
+                new_rows.append((next_id, url, title, self._reverse_host(url), now))
+                next_id += 1
+        
+        cursor.executemany(_SQL_INSERT_PLACE, new_rows)
         
-        return cursor.lastrowid
+        return place_ids
     
     def _reverse_host(self, url: str) -> str:
         """Reverse host for Firefox's rev_host field."""
         try:
-            from urllib.parse import urlparse
-            parsed = urlparse(url)
-            host = parsed.netloc
-            if host:
-                return '.'.join(reversed(host.split('.')))
-        except:
-            pass
-        return ''
+            host = urlsplit(url).netloc
+        except ValueError:
+            return ''
+        return '.'.join(host.split('.')[::-1]) if host else ''
+    
+    def _connect(self) -> sqlite3.Connection:
+        """
+        Open places.sqlite with connection PRAGMAs tuned for bulk access.
+        
+        WAL lets readers proceed while a write is in progress and, together
+        with synchronous=NORMAL, avoids an fsync per statement. Firefox itself
+        keeps places.sqlite in WAL mode, so this does not change the format
+        the browser expects.
+        
+        Returns:
+            Open database connection
+        """
+        conn = sqlite3.connect(str(self.places_db))
+        for pragma in self.CONNECTION_PRAGMAS:
+            try:
+                conn.execute(f"PRAGMA {pragma}")
+            except sqlite3.DatabaseError as e:
+                logger.debug(f"Could not apply PRAGMA {pragma}: {e}")
+        return conn
     
     def _get_next_position(self, conn: sqlite3.Connection, parent_id: int) -> int:
         """Get the next position for a bookmark in a folder."""
@@ -125,86 +207,74 @@ class FirefoxAdapter(BrowserAdapter):
             return row[0] + 1
         return 0
     
-    def _write_bookmark_item(self, conn: sqlite3.Connection, item: Bookmark | BookmarkFolder,
-                            parent_id: int, position: int) -> Optional[int]:
+    def _write_bookmark_items(self, cursor: sqlite3.Cursor,
+                              items: List[Tuple[Bookmark | BookmarkFolder, int, int]]) -> int:
         """
-        Write a bookmark or folder to the database.
+        Write bookmarks and folders (with all their descendants) to the database.
+        
+        The trees are flattened into rows first, with ids assigned up front in
+        the same pre-order a recursive insert would produce, so each table is
+        filled with a single executemany call.
         
         Args:
-            conn: Database connection
-            item: Bookmark or BookmarkFolder to write
-            parent_id: Parent folder ID
-            position: Position within parent
+            cursor: Cursor of the write transaction
+            items: (item, parent_id, position) tuples for the top-level items
             
         Returns:
-            Bookmark ID if successful, None otherwise
+            Number of bookmarks written
         """
-        cursor = conn.cursor()
-        now = self._datetime_to_timestamp(datetime.now())
-        guid = self._generate_guid()
+        cursor.execute(_SQL_MAX_BOOKMARK_ID)
+        first_id = next_id = cursor.fetchone()[0] + 1
         
-        if isinstance(item, Bookmark):
-            # Write bookmark
-            # First ensure place exists
-            place_id = self._get_or_create_place(conn, item.url, item.title)
-            
-            date_added = self._datetime_to_timestamp(item.date_added)
-            date_modified = self._datetime_to_timestamp(item.date_modified)
-            
-            cursor.execute("""
-                INSERT INTO moz_bookmarks 
-                (type, fk, parent, position, title, dateAdded, lastModified, guid)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                self.TYPE_BOOKMARK,
-                place_id,
-                parent_id,
-                position,
-                item.title,
-                date_added,
-                date_modified,
-                guid
-            ))
-            
-            bookmark_id = cursor.lastrowid
-            
-            # Write children (if any - bookmarks shouldn't have children, but handle gracefully)
-            if hasattr(item, 'children') and item.children:
-                logger.warning(f"Bookmark {item.title} has children, which is unexpected")
-            
-            return bookmark_id
-            
-        elif isinstance(item, BookmarkFolder):
-            # Write folder
-            date_added = self._datetime_to_timestamp(item.date_added)
-            date_modified = self._datetime_to_timestamp(item.date_modified)
-            
-            cursor.execute("""
-                INSERT INTO moz_bookmarks 
-                (type, parent, position, title, dateAdded, lastModified, guid)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-            """, (
-                self.TYPE_FOLDER,
-                parent_id,
-                position,
-                item.name,
-                date_added,
-                date_modified,
-                guid
-            ))
-            
-            folder_id = cursor.lastrowid
-            
-            # Write children
-            child_position = 0
-            for child in item.children:
-                child_id = self._write_bookmark_item(conn, child, folder_id, child_position)
-                if child_id:
-                    child_position += 1
+        folder_rows = []
+        pending_bookmarks = []
+        place_titles: Dict[str, str] = {}
+        
+        to_us = _datetime_to_us
+        stack = list(reversed(items))
+        while stack:
+            item, parent_id, position = stack.pop()
+            item_id = next_id
+            next_id += 1
+            date_added = to_us(item.date_added, item.date_added.fold)
+            date_modified = to_us(item.date_modified, item.date_modified.fold)
             
-            return folder_id
+            if item.kind == "url":
+                url = item.url
+                # Later non-empty titles win, as repeated title updates would
+                if url not in place_titles or item.title:
+                    place_titles[url] = item.title
+                pending_bookmarks.append((
+                    item_id, url, parent_id, position, item.title,
+                    date_added, date_modified
+                ))
+            else:
+                folder_rows.append((
+                    item_id, self.TYPE_FOLDER, parent_id, position, item.name,
+                    date_added, date_modified
+                ))
+                children = [
+                    child for child in item.children
+                    if child.kind in ("url", "folder")
+                ]
+                for child_position in range(len(children) - 1, -1, -1):
+                    stack.append((children[child_position], item_id, child_position))
+        
+        guids = self._generate_guids(next_id - first_id)
+        folder_rows = [row + (guids[row[0] - first_id],) for row in folder_rows]
+        
+        place_ids = self._get_or_create_places(cursor, place_titles)
+        bookmark_rows = [
+            (item_id, self.TYPE_BOOKMARK, place_ids[url], parent_id, position,
+             title, date_added, date_modified, guids[item_id - first_id])
+            for item_id, url, parent_id, position, title, date_added, date_modified
+            in pending_bookmarks
+        ]
         
-        return None
+        cursor.executemany(_SQL_INSERT_FOLDER, folder_rows)
+        cursor.executemany(_SQL_INSERT_BOOKMARK, bookmark_rows)
+        
+        return len(bookmark_rows)
     
     def read_bookmarks(self) -> BookmarkTree:
         """
@@ -216,74 +286,89 @@ class FirefoxAdapter(BrowserAdapter):
         if self.is_locked():
             raise RuntimeError("Firefox database is locked. Please close Firefox and try again.")
         
-        conn = sqlite3.connect(str(self.places_db))
-        conn.row_factory = sqlite3.Row
+        conn = self._connect()
         
         try:
+            # One timestamp serves the root and every item without a stored date
+            now = datetime.now()
+            from_timestamp = datetime.fromtimestamp
+            
             # Create root folder
             root = BookmarkFolder(
                 name="Firefox Bookmarks",
-                date_added=datetime.now(),
-                date_modified=datetime.now()
+                date_added=now,
+                date_modified=now
             )
             
             # Read all bookmarks and folders
             cursor = conn.cursor()
             
-            # Get all bookmark items
+            # Walk the tree below the root folders (excluding root 1 which is
+            # the root container) in SQL, returning rows in pre-order: every
+            # folder is followed by its own children, ordered by position (and
+            # by id among items that share a position)
+            # Separators and URLs that cannot have a host (place: queries,
+            # javascript:, about:) are filtered out before reaching Python
             # Note: favicon_id removed as it may not exist in all Firefox versions
             cursor.execute("""
-                SELECT 
-                    b.id,
-                    b.type,
-                    b.parent,
-                    b.title,
-                    b.dateAdded,
-                    b.lastModified,
-                    b.fk as place_id,
-                    p.url,
-                    p.title as url_title
-                FROM moz_bookmarks b
-                LEFT JOIN moz_places p ON b.fk = p.id
-                ORDER BY b.parent, b.position
-            """)
-            
-            rows = cursor.fetchall()
+                WITH RECURSIVE tree(id, type, title, dateAdded, lastModified, url, url_title, depth, path) AS (
+                    SELECT b.id, b.type, b.title, b.dateAdded, b.lastModified, p.url, p.title,
+                           0, printf('%08d/%08d:%010d', b.parent, b.position, b.id)
+                    FROM moz_bookmarks b
+                    LEFT JOIN moz_places p ON b.fk = p.id
+                    WHERE b.parent IN (?, ?, ?, ?)
+                    UNION ALL
+                    SELECT b.id, b.type, b.title, b.dateAdded, b.lastModified, p.url, p.title,
+                           t.depth + 1, t.path || '/' || printf('%08d:%010d', b.position, b.id)
+                    FROM moz_bookmarks b
+                    JOIN tree t ON b.parent = t.id AND t.type = ?
+                    LEFT JOIN moz_places p ON b.fk = p.id
+                )
+                SELECT type, title, dateAdded, lastModified, url, url_title, depth
+                FROM tree
+                WHERE type = ? OR (type = ? AND url LIKE '%://%')
+                ORDER BY path
+            """, (
+                self.ROOT_BOOKMARKS_MENU,
+                self.ROOT_BOOKMARKS_TOOLBAR,
+                self.ROOT_UNFILED,
+                self.ROOT_MOBILE,
+                self.TYPE_FOLDER,
+                self.TYPE_FOLDER,
+                self.TYPE_BOOKMARK
+            ))
             
-            # Build a map of id -> BookmarkFolder or Bookmark
-            items: Dict[int, BookmarkFolder | Bookmark] = {}
-            parent_map: Dict[int, List[int]] = {}  # parent_id -> [child_ids]
+            # parents[depth] is the folder that receives items at that depth
+            parents: List[BookmarkFolder] = [root]
             
-            for row in rows:
-                item_id = row['id']
-                item_type = row['type']
-                parent_id = row['parent']
-                title = row['title'] or ""
+            # Plain tuples, unpacked in SELECT order, and streamed from the cursor
+            for item_type, title, date_added_ts, date_modified_ts, url, url_title, depth in cursor:
+                title = title or ""
                 
                 if item_type == self.TYPE_FOLDER:
-                    date_added = self._timestamp_to_datetime(row['dateAdded']) if row['dateAdded'] else datetime.now()
-                    date_modified = self._timestamp_to_datetime(row['lastModified']) if row['lastModified'] else datetime.now()
+                    # Firefox timestamps are microseconds since epoch
+                    date_added = from_timestamp(date_added_ts / 1000000) if date_added_ts else now
+                    date_modified = from_timestamp(date_modified_ts / 1000000) if date_modified_ts else now
                     
                     folder = BookmarkFolder(
                         name=title,
                         date_added=date_added,
                         date_modified=date_modified
                     )
-                    items[item_id] = folder
-                    
-                    if parent_id not in parent_map:
-                        parent_map[parent_id] = []
-                    parent_map[parent_id].append(item_id)
+                    parents[depth].add_child(folder)
+                    del parents[depth + 1:]
+                    parents.append(folder)
                 
-                elif item_type == self.TYPE_BOOKMARK and row['url']:
-                    url = row['url']
+                else:
+                    # The SQL filter is a cheap superset; this is the exact check
                     if not is_valid_url(url):
                         continue
                     
-                    date_added = self._timestamp_to_datetime(row['dateAdded']) if row['dateAdded'] else datetime.now()
-                    date_modified = self._timestamp_to_datetime(row['lastModified']) if row['lastModified'] else datetime.now()
+                    # Firefox timestamps are microseconds since epoch
+                    date_added = from_timestamp(date_added_ts / 1000000) if date_added_ts else now
+                    date_modified = from_timestamp(date_modified_ts / 1000000) if date_modified_ts else now
                     
-                    bookmark_title = row['url_title'] or title or url
+                    bookmark_title = url_title or title or url
                     
                     bookmark = Bookmark(
                         title=bookmark_title,
@@ -291,43 +376,7 @@ class FirefoxAdapter(BrowserAdapter):
                         date_added=date_added,
                         date_modified=date_modified
                     )
-                    items[item_id] = bookmark
-                    
-                    if parent_id not in parent_map:
-                        parent_map[parent_id] = []
-                    parent_map[parent_id].append(item_id)
-            
-            # Build hierarchy
-            def build_tree(node_id: int) -> Optional[BookmarkFolder | Bookmark]:
-                if node_id not in items:
-                    return None
-                
-                item = items[node_id]
-                
-                # Add children if it's a folder
-                if isinstance(item, BookmarkFolder):
-                    child_ids = parent_map.get(node_id, [])
-                    for child_id in child_ids:
-                        child = build_tree(child_id)
-                        if child:
-                            item.add_child(child)
-                
-                return item
-            
-            # Start from root folders (excluding root 1 which is the root container)
-            root_folder_ids = [
-                self.ROOT_BOOKMARKS_MENU,
-                self.ROOT_BOOKMARKS_TOOLBAR,
-                self.ROOT_UNFILED,
-                self.ROOT_MOBILE
-            ]
-            
-            for root_folder_id in root_folder_ids:
-                if root_folder_id in parent_map:
-                    for child_id in parent_map[root_folder_id]:
-                        child = build_tree(child_id)
-                        if child:
-                            root.add_child(child)
+                    parents[depth].add_child(bookmark)
             
             logger.info(f"Read {len(root.get_all_bookmarks())} bookmarks from Firefox")
             return root
@@ -349,27 +398,49 @@ class FirefoxAdapter(BrowserAdapter):
         if self.is_locked():
             raise RuntimeError("Firefox database is locked. Please close Firefox and try again.")
         
-        conn = sqlite3.connect(str(self.places_db))
+        conn = self._connect()
         
         try:
-            conn.execute("BEGIN TRANSACTION")
+            # One cursor serves every statement of the write
+            cursor = conn.cursor()
+            
+            # Take the write lock up front so the whole sync is one transaction
+            cursor.execute("BEGIN IMMEDIATE")
+            dropped_indexes = []
             
             if clear_existing:
                 # Clear existing bookmarks (but keep root folders)
                 logger.info("Clearing existing bookmarks...")
-                cursor = conn.cursor()
                 
-                # Delete all bookmarks except root folders
-                root_folder_ids = [
+                # Delete everything below the root folders in one statement,
+                # including nested items that would otherwise be orphaned
+                cursor.execute("""
+                    DELETE FROM moz_bookmarks WHERE id IN (
+                        WITH RECURSIVE descendants(id) AS (
+                            SELECT id FROM moz_bookmarks WHERE parent IN (?, ?, ?, ?)
+                            UNION
+                            SELECT b.id FROM moz_bookmarks b
+                            JOIN descendants d ON b.parent = d.id
+                        )
+                        SELECT id FROM descendants
+                    )
+                """, (
                     self.ROOT_BOOKMARKS_MENU,
                     self.ROOT_BOOKMARKS_TOOLBAR,
                     self.ROOT_UNFILED,
                     self.ROOT_MOBILE
-                ]
+                ))
                 
-                # Delete children of root folders
-                for root_id in root_folder_ids:
-                    cursor.execute("DELETE FROM moz_bookmarks WHERE parent = ?", (root_id,))
+                # Only the root folders are left, so it is cheaper to drop the
+                # indexes and rebuild them once after the bulk insert than to
+                # update them row by row
+                cursor.execute("""
+                    SELECT name, sql FROM sqlite_master
+                    WHERE type = 'index' AND tbl_name = 'moz_bookmarks' AND sql IS NOT NULL
+                """)
+                dropped_indexes = cursor.fetchall()
+                for name, _ in dropped_indexes:
+                    cursor.execute(f'DROP INDEX "{name}"')
             
             # Write bookmarks to Bookmarks Menu (root 2) by default
             # Distribute to different roots based on folder names if needed
@@ -392,32 +463,37 @@ class FirefoxAdapter(BrowserAdapter):
             
             # Write children to appropriate root folders
             position = 0
-            written_count = 0
+            top_level_items = []
             
             for child in tree.children:
-                if isinstance(child, BookmarkFolder):
+                kind = child.kind
+                if kind == "folder":
                     # Check if this folder should go to a specific root
                     folder_name = child.name
                     target = root_mapping.get(folder_name, target_root)
                     
-                    # Write folder and its contents
-                    folder_id = self._write_bookmark_item(conn, child, target, position)
-                    if folder_id:
-                        position += 1
-                        written_count += len(child.get_all_bookmarks())
-                elif isinstance(child, Bookmark):
+                    top_level_items.append((child, target, position))
+                    position += 1
+                elif kind == "url":
                     # Write bookmark directly to root
-                    bookmark_id = self._write_bookmark_item(conn, child, target_root, position)
-                    if bookmark_id:
-                        position += 1
-                        written_count += 1
+                    top_level_items.append((child, target_root, position))
+                    position += 1
+            
+            # Write folders and their contents
+            written_count = self._write_bookmark_items(cursor, top_level_items)
+            
+            # Recreate any indexes dropped for the bulk insert
+            for _, sql in dropped_indexes:
+                cursor.execute(sql)
             
             # Update sync change counter (Firefox uses this for sync)
             # Check if column exists first (some Firefox versions may not have it)
-            cursor = conn.cursor()
             try:
-                cursor.execute("PRAGMA table_info(moz_bookmarks)")
-                columns = [row[1] for row in cursor.fetchall()]
+                columns = self._columns_cache.get(self.places_db)
+                if columns is None:
+                    cursor.execute("PRAGMA table_info(moz_bookmarks)")
+                    columns = frozenset(row[1] for row in cursor.fetchall())
+                    self._columns_cache[self.places_db] = columns
                 if 'syncChangeCounter' in columns:
                     cursor.execute("UPDATE moz_bookmarks SET syncChangeCounter = 1 WHERE syncChangeCounter IS NULL")
             except Exception as e:
@@ -430,8 +506,7 @@ class FirefoxAdapter(BrowserAdapter):
         except Exception as e:
             conn.rollback()
             logger.error(f"Failed to write Firefox bookmarks: {e}")
-            import traceback
-            logger.debug(traceback.format_exc())
+            logger.debug("Firefox write failure traceback:", exc_info=True)
             return False
         finally:
             conn.close()
@@ -1,20 +1,36 @@
 """Change detection for incremental sync."""
 
-import hashlib
-from typing import List, Set, Dict, Tuple
+from hashlib import blake2b
+from typing import Callable, Iterable, List, Dict, Optional, Tuple
 from datetime import datetime
 from src.core.models import BookmarkTree, Bookmark, BookmarkFolder
 from src.utils.logger import setup_logger
 
 logger = setup_logger()
 
+# BLAKE2b truncated to 128 bits keeps the 32-character hex digests the
+# MD5-based hashes had, and is faster than MD5 for short inputs
+HASH_DIGEST_SIZE = 16
+
+
+def blake2b_hash(data: bytes) -> str:
+    """Hex digest of data using 128-bit BLAKE2b (the default bookmark hash)."""
+    return blake2b(data, digest_size=HASH_DIGEST_SIZE).hexdigest()
+
 
 class ChangeDetector:
     """Detects changes in bookmarks for incremental sync."""
     
-    def __init__(self):
-        """Initialize change detector."""
-        pass
+    def __init__(self, hash_fn: Callable[[bytes], str] = blake2b_hash):
+        """
+        Initialize change detector.
+        
+        Args:
+            hash_fn: Function mapping encoded bookmark content to a hex digest.
+                Stored hashes are only comparable when made with the same one,
+                so anything persisting hashes should keep a fixed function.
+        """
+        self.hash_fn = hash_fn
     
     def compute_bookmark_hash(self, bookmark: Bookmark) -> str:
         """
@@ -28,40 +44,42 @@ class ChangeDetector:
         """
         # Hash based on URL, title, and date_modified
         content = f"{bookmark.url}|{bookmark.title}|{bookmark.date_modified.isoformat()}"
-        return hashlib.md5(content.encode()).hexdigest()
+        return self.hash_fn(content.encode())
     
     def detect_changes(self, current_tree: BookmarkTree, 
-                      previous_hashes: Dict[str, str]) -> Tuple[List[Bookmark], List[Bookmark], List[str]]:
+                      previous_hashes: Dict[str, str],
+                      current_hashes: Optional[Dict[str, str]] = None) -> Tuple[List[Bookmark], List[Bookmark], List[str]]:
         """
         Detect changes between current bookmarks and previous state.
         
+        Bookmarks sharing a URL are compared once, using the last one in the
+        tree, which is the one get_all_bookmark_hashes records.
+        
         Args:
             current_tree: Current bookmark tree
-            previous_hashes: Dict mapping URL -> hash from previous sync
+            previous_hashes: Dict mapping URL (lowercase, as produced by
+                get_all_bookmark_hashes) -> hash from previous sync
+            current_hashes: Hashes of current_tree if already computed (from
+                get_all_bookmark_hashes or validate_and_hash)
             
         Returns:
             Tuple of (new_bookmarks, modified_bookmarks, deleted_urls)
         """
-        current_bookmarks = current_tree.get_all_bookmarks()
-        current_urls: Set[str] = set()
-        new_bookmarks: List[Bookmark] = []
-        modified_bookmarks: List[Bookmark] = []
+        current_bookmarks = {bookmark.url.lower(): bookmark
+                             for bookmark in current_tree.iter_all_bookmarks()}
+        if current_hashes is None:
+            current_hashes = self._hash_bookmarks(current_bookmarks.values())
         
-        for bookmark in current_bookmarks:
-            url = bookmark.url.lower()
-            current_urls.add(url)
-            current_hash = self.compute_bookmark_hash(bookmark)
-            
-            if url not in previous_hashes:
-                # New bookmark
-                new_bookmarks.append(bookmark)
-            elif previous_hashes[url] != current_hash:
-                # Modified bookmark
-                modified_bookmarks.append(bookmark)
+        new_urls = current_hashes.keys() - previous_hashes.keys()
+        changed_urls = {url for url, _ in current_hashes.items() - previous_hashes.items()}
+        
+        new_bookmarks = [bookmark for url, bookmark in current_bookmarks.items()
+                         if url in new_urls]
+        modified_bookmarks = [bookmark for url, bookmark in current_bookmarks.items()
+                              if url in changed_urls and url not in new_urls]
         
         # Find deleted bookmarks (in previous but not in current)
-        deleted_urls = [url for url in previous_hashes.keys() 
-                       if url.lower() not in current_urls]
+        deleted_urls = [url for url in previous_hashes if url not in current_hashes]
         
         logger.info(f"Change detection: {len(new_bookmarks)} new, "
                    f"{len(modified_bookmarks)} modified, {len(deleted_urls)} deleted")
@@ -78,10 +96,70 @@ class ChangeDetector:
         Returns:
             Dict mapping URL (lowercase) -> hash
         """
+        return self._hash_bookmarks(tree.iter_all_bookmarks())
+    
+    def hash_bookmark_fields(self, fields: Iterable[Tuple[str, str, datetime]]) -> Dict[str, str]:
+        """
+        Hash raw bookmark fields, as get_all_bookmark_hashes does for a tree.
+        
+        Args:
+            fields: (url, title, date_modified) tuples, e.g. from
+                ChromeAdapter.iter_bookmark_fields
+            
+        Returns:
+            Dict mapping URL (lowercase) -> hash
+        """
+        hash_fn = self.hash_fn
+        return {url.lower(): hash_fn(f"{url}|{title}|{date_modified.isoformat()}".encode())
+                for url, title, date_modified in fields}
+    
+    def validate_and_hash(self, tree: BookmarkTree,
+                          is_valid_url: Callable[[str], bool]) -> Dict[str, str]:
+        """
+        Validate every bookmark and hash it in the same walk over the tree.
+        
+        Args:
+            tree: Bookmark tree
+            is_valid_url: URL validator; an invalid URL aborts the walk
+            
+        Returns:
+            Dict mapping URL (lowercase) -> hash, as get_all_bookmark_hashes
+            
+        Raises:
+            ValueError: If a bookmark has an invalid URL
+        """
+        hash_fn = self.hash_fn
+        hashes = {}
+        for bookmark in tree.iter_all_bookmarks():
+            url = bookmark.url
+            if not is_valid_url(url):
+                raise ValueError(f"Invalid URL in bookmark: {url}")
+            
+            title = bookmark.title
+            if not title or len(title.strip()) == 0:
+                logger.warning(f"Bookmark with empty title: {url}")
+            
+            content = f"{url}|{title}|{bookmark.date_modified.isoformat()}"
+            hashes[url.lower()] = hash_fn(content.encode())
+        return hashes
+    
+    def _hash_bookmarks(self, bookmarks: Iterable[Bookmark]) -> Dict[str, str]:
+        """
+        Hash bookmarks keyed by lowercase URL; later bookmarks win on duplicates.
+        
+        Args:
+            bookmarks: Bookmarks to hash
+            
+        Returns:
+            Dict mapping URL (lowercase) -> hash
+        """
+        # Inlined compute_bookmark_hash with names bound to locals for the hot loop
+        hash_fn = self.hash_fn
         hashes = {}
-        for bookmark in tree.get_all_bookmarks():
-            url = bookmark.url.lower()
-            hashes[url] = self.compute_bookmark_hash(bookmark)
+        for bookmark in bookmarks:
+            url = bookmark.url
+            content = f"{url}|{bookmark.title}|{bookmark.date_modified.isoformat()}"
+            hashes[url.lower()] = hash_fn(content.encode())
         return hashes
     
     def create_incremental_tree(self, new_bookmarks: List[Bookmark],
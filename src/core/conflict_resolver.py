@@ -1,7 +1,7 @@
 """Conflict detection and resolution for bookmarks."""
 
-from dataclasses import dataclass
-from typing import List, Optional
+from dataclasses import dataclass, replace
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime
 from src.core.models import Bookmark
 from src.utils.logger import setup_logger
@@ -28,6 +28,8 @@ class ConflictResolver:
     
     def __init__(self):
         self.conflicts: List[BookmarkConflict] = []
+        # Raw URL -> normalized URL, so each URL is normalized once
+        self._normalized_urls: Dict[str, str] = {}
     
     def detect_conflicts(self, bookmark1: Bookmark, bookmark2: Bookmark,
                         source1_name: str, source2_name: str) -> Optional[BookmarkConflict]:
@@ -43,38 +45,64 @@ class ConflictResolver:
         Returns:
             BookmarkConflict if conflict detected, None otherwise
         """
-        # Normalize URLs for comparison
-        url1 = self._normalize_url(bookmark1.url)
-        url2 = self._normalize_url(bookmark2.url)
-        
-        if url1 != url2:
-            return None  # Different URLs, not a conflict
-        
-        # Check for conflicts
-        conflicts = []
-        
-        if bookmark1.title != bookmark2.title:
-            conflicts.append('title')
-        
-        if bookmark1.date_added != bookmark2.date_added:
-            conflicts.append('date')
+        conflicts = self.detect_conflicts_batch(
+            [(bookmark1, bookmark2)], source1_name, source2_name
+        )
+        return conflicts[0] if conflicts else None
+    
+    def detect_conflicts_batch(self, pairs: List[Tuple[Bookmark, Bookmark]],
+                               source1_name: str, source2_name: str) -> List[BookmarkConflict]:
+        """
+        Detect conflicts for many bookmark pairs in one call.
         
-        if bookmark1.favicon != bookmark2.favicon:
-            conflicts.append('metadata')
+        Args:
+            pairs: (bookmark from first source, bookmark from second source) pairs
+            source1_name: Name of first source
+            source2_name: Name of second source
+            
+        Returns:
+            Conflicts detected, in pair order (also added to self.conflicts)
+        """
+        normalized = self._normalized_urls
+        normalize_url = self._normalize_url
+        found: List[BookmarkConflict] = []
         
-        if conflicts:
-            conflict = BookmarkConflict(
-                url=bookmark1.url,
-                bookmark1=bookmark1,
-                bookmark2=bookmark2,
-                source1_name=source1_name,
-                source2_name=source2_name,
-                conflict_type=', '.join(conflicts)
-            )
-            self.conflicts.append(conflict)
-            return conflict
+        for bookmark1, bookmark2 in pairs:
+            # Normalize URLs for comparison
+            url1 = normalized.get(bookmark1.url)
+            if url1 is None:
+                url1 = normalized[bookmark1.url] = normalize_url(bookmark1.url)
+            url2 = normalized.get(bookmark2.url)
+            if url2 is None:
+                url2 = normalized[bookmark2.url] = normalize_url(bookmark2.url)
+            
+            if url1 != url2:
+                continue  # Different URLs, not a conflict
+            
+            # Check for conflicts
+            conflicts = []
+            
+            if bookmark1.title != bookmark2.title:
+                conflicts.append('title')
+            
+            if bookmark1.date_added != bookmark2.date_added:
+                conflicts.append('date')
+            
+            if bookmark1.favicon != bookmark2.favicon:
+                conflicts.append('metadata')
+            
+            if conflicts:
+                found.append(BookmarkConflict(
+                    url=bookmark1.url,
+                    bookmark1=bookmark1,
+                    bookmark2=bookmark2,
+                    source1_name=source1_name,
+                    source2_name=source2_name,
+                    conflict_type=', '.join(conflicts)
+                ))
         
-        return None
+        self.conflicts.extend(found)
+        return found
     
     def resolve_conflict(self, conflict: BookmarkConflict, resolution: str) -> Bookmark:
         """
@@ -97,34 +125,26 @@ class ConflictResolver:
             else:
                 return conflict.bookmark2
         elif resolution == 'merge':
-            # Merge metadata: use newer title, newer date
-            if conflict.bookmark1.date_modified > conflict.bookmark2.date_modified:
-                resolved = conflict.bookmark1
-                # But keep both titles if significantly different
-                if conflict.bookmark1.title != conflict.bookmark2.title:
-                    resolved.title = f"{conflict.bookmark1.title} / {conflict.bookmark2.title}"
-            else:
-                resolved = conflict.bookmark2
-                if conflict.bookmark1.title != conflict.bookmark2.title:
-                    resolved.title = f"{conflict.bookmark1.title} / {conflict.bookmark2.title}"
-            return resolved
+            # Merge metadata: use newer bookmark, newer date
+            bookmark1, bookmark2 = conflict.bookmark1, conflict.bookmark2
+            newer = bookmark1 if bookmark1.date_modified > bookmark2.date_modified else bookmark2
+            if bookmark1.title == bookmark2.title:
+                return newer
+            # But keep both titles if different, on a copy so the source
+            # bookmarks are left untouched
+            return replace(newer, title=f"{bookmark1.title} / {bookmark2.title}")
         else:
             # Default: keep newer
             return self.resolve_conflict(conflict, 'keep_newer')
     
     def _normalize_url(self, url: str) -> str:
         """Normalize URL for comparison."""
-        url = url.lower().strip()
-        
-        # Remove trailing slash
-        if url.endswith('/'):
-            url = url[:-1]
-        
         # Normalize protocol (http vs https)
         # For now, we treat them as different, but could normalize
         # url = url.replace('https://', 'http://')
         
-        return url
+        # Lowercase, trim, and remove trailing slash
+        return url.lower().strip().removesuffix('/')
     
     def get_conflicts_summary(self) -> str:
         """Get a summary of all conflicts."""
@@ -1,15 +1,146 @@
 """Merge engine for combining bookmarks from different sources."""
 
-from typing import List, Set, Dict, Tuple, Optional
+import re
+import sys
+from dataclasses import dataclass, field, replace
+from typing import List, Set, FrozenSet, Dict, Tuple, Optional
 from enum import Enum
-from datetime import datetime
+from functools import lru_cache
 from urllib.parse import urlparse, urlunparse
 from src.core.models import BookmarkTree, BookmarkFolder, Bookmark
+from src.core.packed_tree import PackedTree
 from src.core.conflict_resolver import ConflictResolver, BookmarkConflict
 from src.utils.logger import setup_logger
 
 logger = setup_logger()
 
+# Candidate netloc: everything after the first '//' up to the path, query or fragment
+_NETLOC_RE = re.compile(r'//([^/?#]*)')
+
+
+@lru_cache(maxsize=65536)
+def normalize_url(url: str) -> str:
+    """
+    Normalize URL for comparison.
+    
+    Results are memoized per URL string, since merges normalize the same
+    URLs many times over, and interned so equal keys from different raw
+    URLs share one string object.
+    
+    Handles:
+    - Case insensitivity
+    - Trailing slashes
+    - Protocol normalization (optional)
+    """
+    url = url.lower().strip()
+    
+    # Remove trailing slash (except for root URLs)
+    if url.endswith('/') and len(url) > 1:
+        url = url[:-1]
+    
+    # Remove fragment (#anchor)
+    url = url.partition('#')[0]
+    
+    # A port can only come from a ':' in the netloc, so most URLs can skip
+    # urlparse entirely. Anything unusual (brackets, non-ASCII hosts, or the
+    # tab/newline characters urlparse strips before splitting) still takes
+    # the full path so results and errors stay identical.
+    if '\t' not in url and '\r' not in url and '\n' not in url:
+        match = _NETLOC_RE.search(url)
+        if match is None:
+            return sys.intern(url)
+        netloc = match.group(1)
+        if netloc.isascii() and ':' not in netloc and '[' not in netloc and ']' not in netloc:
+            return sys.intern(url)
+    
+    # Remove default ports
+    parsed = urlparse(url)
+    if parsed.port:
+        if (parsed.scheme == 'http' and parsed.port == 80) or \
+           (parsed.scheme == 'https' and parsed.port == 443):
+            # Reconstruct without port
+            netloc = parsed.hostname
+            if parsed.username or parsed.password:
+                auth = f"{parsed.username}:{parsed.password}@" if parsed.password else f"{parsed.username}@"
+                netloc = auth + netloc
+            url = urlunparse((
+                parsed.scheme,
+                netloc,
+                parsed.path,
+                parsed.params,
+                parsed.query,
+                ''  # fragment
+            ))
+    
+    return sys.intern(url)
+
+
+def normalize_urls(urls: List[str]) -> List[str]:
+    """
+    Normalize a batch of URLs in one call.
+    
+    Each distinct URL is normalized once, so trees with many repeated URLs
+    don't pay for the cache lookup per bookmark.
+    
+    Args:
+        urls: URLs to normalize
+        
+    Returns:
+        Normalized URLs, in the same order as the input
+    """
+    normalized = {url: None for url in urls}
+    for url in normalized:
+        normalized[url] = normalize_url(url)
+    return [normalized[url] for url in urls]
+
+
+@lru_cache(maxsize=65536)
+def _fuzzy_url_key(normalized_url: str) -> Tuple[str, str]:
+    """Get the (domain without www., path without trailing slash) fuzzy-match key."""
+    parsed = urlparse(normalized_url)
+    return parsed.netloc.replace('www.', ''), parsed.path.rstrip('/')
+
+
+@dataclass
+class MatchIndex:
+    """Lookup maps over one tree's bookmarks for duplicate detection."""
+    url_map: Dict[str, Bookmark] = field(default_factory=dict)
+    name_url_map: Dict[Tuple[str, str], Bookmark] = field(default_factory=dict)
+    fuzzy_map: Dict[Tuple[str, str], Bookmark] = field(default_factory=dict)
+    
+    def find(self, normalized_url: str, title: str,
+             url_only: bool = False) -> Tuple[Optional[Bookmark], Optional[str]]:
+        """
+        Find the best match for a bookmark, trying exact URL, then name+URL,
+        then fuzzy URL.
+        
+        Args:
+            normalized_url: Normalized URL of the bookmark to match
+            title: Title of the bookmark to match (lowercased only if a
+                name+URL lookup is actually needed)
+            url_only: Only try the exact URL match
+            
+        Returns:
+            Tuple of (matched bookmark, match type), or (None, None)
+        """
+        match = self.url_map.get(normalized_url)
+        if match is not None:
+            return match, 'url'
+        if url_only:
+            return None, None
+        
+        if self.name_url_map:
+            match = self.name_url_map.get((title.lower(), normalized_url))
+            if match is not None:
+                return match, 'name+url'
+        
+        if self.fuzzy_map:
+            match = self.fuzzy_map.get(_fuzzy_url_key(normalized_url))
+            if match is not None:
+                return match, 'fuzzy_url'
+        
+        return None, None
+
 
 class MergeStrategy(Enum):
     """Merge strategies."""
@@ -39,9 +170,11 @@ class BookmarkMerger:
         self.enable_name_matching = enable_name_matching
         self.conflict_resolver = ConflictResolver()
         self.duplicate_matches: List[Tuple[Bookmark, Bookmark, str]] = []  # (bookmark1, bookmark2, match_type)
+        self._take_ownership = False
     
     def merge(self, tree1: BookmarkTree, tree2: BookmarkTree, 
-              source1_name: str = "Source 1", source2_name: str = "Source 2") -> BookmarkTree:
+              source1_name: str = "Source 1", source2_name: str = "Source 2",
+              take_ownership: bool = False) -> BookmarkTree:
         """
         Merge two bookmark trees.
         
@@ -50,6 +183,9 @@ class BookmarkMerger:
             tree2: Second bookmark tree
             source1_name: Name of first source (for duplicate naming)
             source2_name: Name of second source (for duplicate naming)
+            take_ownership: Move nodes from the input trees into the result
+                instead of copying them. The inputs are emptied and must not
+                be used afterwards.
             
         Returns:
             Merged BookmarkTree
@@ -57,6 +193,7 @@ class BookmarkMerger:
         # Reset conflict resolver for new merge
         self.conflict_resolver = ConflictResolver()
         self.duplicate_matches = []
+        self._take_ownership = take_ownership
         
         merged = BookmarkFolder(
             name="Merged Bookmarks",
@@ -77,6 +214,11 @@ class BookmarkMerger:
         else:
             result = self._merge_keep_all(tree1, tree2, merged, source1_name, source2_name)
         
+        if take_ownership:
+            # Nodes now belong to the merged tree
+            tree1.children = []
+            tree2.children = []
+        
         # Log conflicts if any
         if self.conflict_resolver.conflicts:
             logger.info(f"Detected {len(self.conflict_resolver.conflicts)} conflict(s)")
@@ -100,47 +242,53 @@ class BookmarkMerger:
         tree2_bookmarks = tree2.get_all_bookmarks()
         
         # Build matching maps
-        tree1_url_map = {self._normalize_url(b.url): b for b in tree1_bookmarks}
-        tree1_name_url_map = {(b.title.lower(), self._normalize_url(b.url)): b for b in tree1_bookmarks}
+        match_index = self._build_match_index(tree1_bookmarks)
         
         # Detect duplicates and conflicts
         tree2_duplicates: Set[str] = set()
-        for b2 in tree2_bookmarks:
-            normalized_url = self._normalize_url(b2.url)
-            
-            # Check for exact URL match
-            if normalized_url in tree1_url_map:
-                b1 = tree1_url_map[normalized_url]
-                conflict = self.conflict_resolver.detect_conflicts(b1, b2, source1_name, source2_name)
+        matched_pairs: List[Tuple[Bookmark, Bookmark]] = []
+        tree2_urls = normalize_urls([b2.url for b2 in tree2_bookmarks])
+        for b2, normalized_url in zip(tree2_bookmarks, tree2_urls):
+            # Exact URL matches are always checked; name+URL and fuzzy matches
+            # only for URLs that no earlier bookmark has matched yet
+            b1, match_type = match_index.find(
+                normalized_url, b2.title,
+                url_only=normalized_url in tree2_duplicates
+            )
+            if b1 is not None:
+                matched_pairs.append((b1, b2))
                 tree2_duplicates.add(normalized_url)
-                self.duplicate_matches.append((b1, b2, 'url'))
-            
-            # Check for name+URL match if enabled (only if exact URL didn't match)
-            if normalized_url not in tree2_duplicates and self.enable_name_matching:
-                name_url_key = (b2.title.lower(), normalized_url)
-                if name_url_key in tree1_name_url_map:
-                    b1 = tree1_name_url_map[name_url_key]
-                    conflict = self.conflict_resolver.detect_conflicts(b1, b2, source1_name, source2_name)
-                    tree2_duplicates.add(normalized_url)
-                    self.duplicate_matches.append((b1, b2, 'name+url'))
-            
-            # Check for fuzzy URL match if enabled (only if no other match found)
-            if normalized_url not in tree2_duplicates and self.enable_fuzzy_matching:
-                fuzzy_match = self._find_fuzzy_match(b2, tree1_bookmarks)
-                if fuzzy_match:
-                    conflict = self.conflict_resolver.detect_conflicts(fuzzy_match, b2, source1_name, source2_name)
-                    tree2_duplicates.add(normalized_url)
-                    self.duplicate_matches.append((fuzzy_match, b2, 'fuzzy_url'))
+                self.duplicate_matches.append((b1, b2, match_type))
+        self.conflict_resolver.detect_conflicts_batch(matched_pairs, source1_name, source2_name)
         
         # Add all items from tree1
         for child in tree1.children:
-            merged.add_child(self._deep_copy(child))
+            merged.add_child(self._adopt(child))
         
         # Add items from tree2, renaming duplicates
-        for child in tree2.children:
-            copied = self._deep_copy(child)
-            self._rename_duplicates(copied, tree2_duplicates, source2_name)
-            merged.add_child(copied)
+        if self._take_ownership:
+            # Swap in renamed copies rather than renaming in place: the
+            # originals are referenced by the recorded conflicts and matches
+            renamed = {id(b2) for b2, normalized_url in zip(tree2_bookmarks, tree2_urls)
+                       if normalized_url in tree2_duplicates}
+            if renamed:
+                for folder in [tree2, *tree2.get_all_folders()]:
+                    folder.children = [
+                        replace(child, title=f"{child.title} ({source2_name})")
+                        if id(child) in renamed else child
+                        for child in folder.children
+                    ]
+            merged.children.extend(tree2.children)
+        else:
+            # Rename in tree2's flat columns and build the copy in one pass
+            # instead of deep-copying and re-walking the tree
+            packed2 = PackedTree.from_tree(tree2)
+            if tree2_duplicates:
+                names = packed2.names
+                for i, normalized_url in zip(packed2.bookmark_indices(), tree2_urls):
+                    if normalized_url in tree2_duplicates:
+                        names[i] = f"{names[i]} ({source2_name})"
+            merged.children.extend(packed2.to_tree().children)
         
         logger.info(f"Merged {len(merged.get_all_bookmarks())} bookmarks using keep_all strategy")
         if tree2_duplicates:
@@ -157,34 +305,29 @@ class BookmarkMerger:
         tree1_bookmarks = tree1.get_all_bookmarks()
         tree2_bookmarks = tree2.get_all_bookmarks()
         
-        for bookmark in tree1_bookmarks:
-            normalized_url = self._normalize_url(bookmark.url)
-            if normalized_url not in url_map:
-                url_map[normalized_url] = bookmark
-            elif bookmark.date_modified > url_map[normalized_url].date_modified:
-                # Detect conflict before replacing
-                self.conflict_resolver.detect_conflicts(
-                    url_map[normalized_url], bookmark, "Source 1", "Source 1"
-                )
-                url_map[normalized_url] = bookmark
-        
-        for bookmark in tree2_bookmarks:
-            normalized_url = self._normalize_url(bookmark.url)
-            if normalized_url not in url_map:
-                url_map[normalized_url] = bookmark
-            else:
-                # Check for conflicts
-                existing = url_map[normalized_url]
-                conflict = self.conflict_resolver.detect_conflicts(
-                    existing, bookmark, "Source 1", "Source 2"
-                )
-                # Keep newer
-                if bookmark.date_modified > existing.date_modified:
+        # One loop body for both trees. Within tree1 a duplicate is only a
+        # conflict when it replaces the kept bookmark; every tree2 duplicate is
+        # checked against what is kept so far.
+        for from_tree2, bookmarks in ((False, tree1_bookmarks), (True, tree2_bookmarks)):
+            conflict_pairs: List[Tuple[Bookmark, Bookmark]] = []
+            normalized_urls = normalize_urls([bookmark.url for bookmark in bookmarks])
+            for bookmark, normalized_url in zip(bookmarks, normalized_urls):
+                existing = url_map.get(normalized_url)
+                if existing is None:
                     url_map[normalized_url] = bookmark
+                    continue
+                newer = bookmark.date_modified > existing.date_modified
+                if from_tree2 or newer:
+                    conflict_pairs.append((existing, bookmark))
+                if newer:
+                    url_map[normalized_url] = bookmark
+            self.conflict_resolver.detect_conflicts_batch(
+                conflict_pairs, "Source 1", "Source 2" if from_tree2 else "Source 1"
+            )
         
         # Add all bookmarks to root (simplified - could preserve structure better)
         for bookmark in url_map.values():
-            merged.add_child(self._deep_copy(bookmark))
+            merged.add_child(self._adopt(bookmark))
         
         logger.info(f"Merged {len(merged.get_all_bookmarks())} bookmarks using timestamp strategy")
         return merged
@@ -193,28 +336,32 @@ class BookmarkMerger:
                        merged: BookmarkFolder, primary_name: str) -> BookmarkTree:
         """Merge with priority to primary source."""
         primary_bookmarks = primary.get_all_bookmarks()
-        primary_urls: Set[str] = {self._normalize_url(b.url) for b in primary_bookmarks}
+        # Normalized URL -> first primary bookmark with that URL
+        primary_map: Dict[str, Bookmark] = {}
+        for b1, normalized_url in zip(primary_bookmarks,
+                                      normalize_urls([b.url for b in primary_bookmarks])):
+            primary_map.setdefault(normalized_url, b1)
+        primary_urls = frozenset(primary_map)
         
         # Detect conflicts
         secondary_bookmarks = secondary.get_all_bookmarks()
-        for b2 in secondary_bookmarks:
-            normalized_url = self._normalize_url(b2.url)
-            if normalized_url in primary_urls:
-                # Find matching bookmark in primary
-                for b1 in primary_bookmarks:
-                    if self._normalize_url(b1.url) == normalized_url:
-                        self.conflict_resolver.detect_conflicts(b1, b2, primary_name, "Secondary")
-                        break
+        conflict_pairs = []
+        for b2, normalized_url in zip(secondary_bookmarks,
+                                      normalize_urls([b.url for b in secondary_bookmarks])):
+            b1 = primary_map.get(normalized_url)
+            if b1 is not None:
+                conflict_pairs.append((b1, b2))
+        self.conflict_resolver.detect_conflicts_batch(conflict_pairs, primary_name, "Secondary")
         
         # Add all from primary
         for child in primary.children:
-            merged.add_child(self._deep_copy(child))
+            merged.add_child(self._adopt(child))
         
         # Add from secondary only if not in primary
         for child in secondary.children:
-            copied = self._deep_copy(child)
+            copied = self._adopt(child)
             self._filter_duplicates(copied, primary_urls)
-            if (isinstance(copied, BookmarkFolder) and copied.children) or isinstance(copied, Bookmark):
+            if copied is not None and (copied.kind == "url" or copied.children):
                 merged.add_child(copied)
         
         logger.info(f"Merged {len(merged.get_all_bookmarks())} bookmarks using priority strategy")
@@ -222,41 +369,39 @@ class BookmarkMerger:
     
     def _merge_smart(self, tree1: BookmarkTree, tree2: BookmarkTree, merged: BookmarkFolder) -> BookmarkTree:
         """Smart merge preserving folder structure."""
-        # Merge folders by name, bookmarks by URL
+        # Merge folders by name, bookmarks by normalized URL (same as the
+        # other strategies)
         folder_map: dict[str, BookmarkFolder] = {}
         url_set: Set[str] = set()
         
-        def add_tree_to_merged(tree: BookmarkTree):
+        def add_folder(folder: BookmarkFolder):
+            target = folder_map.get(folder.name)
+            if target is None:
+                target = folder_map[folder.name] = BookmarkFolder(
+                    name=folder.name,
+                    date_added=folder.date_added,
+                    date_modified=folder.date_modified
+                )
+            # Merge folder contents
+            for subchild in folder.children:
+                if subchild.kind == "url":
+                    normalized_url = normalize_url(subchild.url)
+                    if normalized_url not in url_set:
+                        target.add_child(self._adopt(subchild))
+                        url_set.add(normalized_url)
+                elif subchild.kind == "folder":
+                    # Nested folders are merged by name like top-level ones
+                    add_folder(subchild)
+        
+        for tree in (tree1, tree2):
             for child in tree.children:
-                if isinstance(child, BookmarkFolder):
-                    folder_name = child.name
-                    if folder_name not in folder_map:
-                        folder_map[folder_name] = BookmarkFolder(
-                            name=folder_name,
-                            date_added=child.date_added,
-                            date_modified=child.date_modified
-                        )
-                    # Merge folder contents
-                    for subchild in child.children:
-                        if isinstance(subchild, Bookmark):
-                            if subchild.url.lower() not in url_set:
-                                folder_map[folder_name].add_child(self._deep_copy(subchild))
-                                url_set.add(subchild.url.lower())
-                        elif isinstance(subchild, BookmarkFolder):
-                            # Recursively handle nested folders
-                            add_tree_to_merged(BookmarkFolder(
-                                name="temp",
-                                date_added=datetime.now(),
-                                date_modified=datetime.now(),
-                                children=[subchild]
-                            ))
-                elif isinstance(child, Bookmark):
-                    if child.url.lower() not in url_set:
-                        merged.add_child(self._deep_copy(child))
-                        url_set.add(child.url.lower())
-        
-        add_tree_to_merged(tree1)
-        add_tree_to_merged(tree2)
+                if child.kind == "folder":
+                    add_folder(child)
+                elif child.kind == "url":
+                    normalized_url = normalize_url(child.url)
+                    if normalized_url not in url_set:
+                        merged.add_child(self._adopt(child))
+                        url_set.add(normalized_url)
         
         # Add merged folders to root
         for folder in folder_map.values():
@@ -266,128 +411,114 @@ class BookmarkMerger:
         logger.info(f"Merged {len(merged.get_all_bookmarks())} bookmarks using smart strategy")
         return merged
     
+    def _adopt(self, item: BookmarkFolder | Bookmark) -> BookmarkFolder | Bookmark:
+        """Get the item itself when the merge owns its inputs, otherwise a deep copy."""
+        if self._take_ownership:
+            return item
+        return self._deep_copy(item)
+    
     def _deep_copy(self, item: BookmarkFolder | Bookmark) -> BookmarkFolder | Bookmark:
         """Create a deep copy of a bookmark or folder."""
-        if isinstance(item, Bookmark):
-            return Bookmark(
-                title=item.title,
-                url=item.url,
-                date_added=item.date_added,
-                date_modified=item.date_modified,
-                favicon=item.favicon,
-                tags=item.tags.copy() if item.tags else []
-            )
-        elif isinstance(item, BookmarkFolder):
-            folder = BookmarkFolder(
-                name=item.name,
-                date_added=item.date_added,
-                date_modified=item.date_modified
-            )
-            for child in item.children:
-                folder.add_child(self._deep_copy(child))
-            return folder
-        return item
+        kind = item.kind
+        if kind == "url":
+            return self._copy_bookmark(item)
+        elif kind != "folder":
+            return item
+        
+        # Copy folders with an explicit stack instead of recursing per level
+        copy_bookmark = self._copy_bookmark
+        root = BookmarkFolder(
+            name=item.name,
+            date_added=item.date_added,
+            date_modified=item.date_modified
+        )
+        stack = [(item, root)]
+        while stack:
+            source, target = stack.pop()
+            children = [None] * len(source.children)
+            for i, child in enumerate(source.children):
+                kind = child.kind
+                if kind == "url":
+                    children[i] = copy_bookmark(child)
+                elif kind == "folder":
+                    folder = BookmarkFolder(
+                        name=child.name,
+                        date_added=child.date_added,
+                        date_modified=child.date_modified
+                    )
+                    children[i] = folder
+                    stack.append((child, folder))
+                else:
+                    children[i] = child
+            target.children = children
+        return root
     
-    def _rename_duplicates(self, item: BookmarkFolder | Bookmark, existing_urls: Set[str], source_name: str):
-        """Rename duplicates by appending source name."""
-        if isinstance(item, Bookmark):
-            normalized_url = self._normalize_url(item.url)
-            if normalized_url in existing_urls:
-                item.title = f"{item.title} ({source_name})"
-        elif isinstance(item, BookmarkFolder):
-            for child in item.children:
-                self._rename_duplicates(child, existing_urls, source_name)
+    @staticmethod
+    def _copy_bookmark(bookmark: Bookmark) -> Bookmark:
+        """Create a copy of a bookmark with its own tags list."""
+        return Bookmark(
+            title=bookmark.title,
+            url=bookmark.url,
+            date_added=bookmark.date_added,
+            date_modified=bookmark.date_modified,
+            favicon=bookmark.favicon,
+            tags=bookmark.tags.copy() if bookmark.tags else []
+        )
     
-    def _filter_duplicates(self, item: BookmarkFolder | Bookmark, existing_urls: Set[str]):
+    def _filter_duplicates(self, item: BookmarkFolder | Bookmark, existing_urls: FrozenSet[str]):
         """Remove items that already exist (for priority merge)."""
-        if isinstance(item, Bookmark):
-            if self._normalize_url(item.url) in existing_urls:
+        is_existing = existing_urls.__contains__
+        kind = item.kind
+        if kind == "url":
+            if is_existing(self._normalize_url(item.url)):
                 return None  # Mark for removal
-        elif isinstance(item, BookmarkFolder):
+        elif kind == "folder":
+            # Bookmarks are checked inline; only subfolders recurse
+            normalize = self._normalize_url
             filtered_children = []
+            keep = filtered_children.append
             for child in item.children:
-                filtered = self._filter_duplicates(child, existing_urls)
-                if filtered is not None:
-                    filtered_children.append(filtered)
+                child_kind = child.kind
+                if child_kind == "url":
+                    if not is_existing(normalize(child.url)):
+                        keep(child)
+                elif child_kind == "folder":
+                    keep(self._filter_duplicates(child, existing_urls))
+                else:
+                    keep(child)
             item.children = filtered_children
         return item
     
-    def _normalize_url(self, url: str) -> str:
-        """
-        Normalize URL for comparison.
-        
-        Handles:
-        - Case insensitivity
-        - Trailing slashes
-        - Protocol normalization (optional)
-        """
-        url = url.lower().strip()
-        
-        # Remove trailing slash (except for root URLs)
-        if url.endswith('/') and len(url) > 1:
-            url = url[:-1]
-        
-        # Remove fragment (#anchor)
-        if '#' in url:
-            url = url.split('#')[0]
-        
-        # Remove default ports
-        parsed = urlparse(url)
-        if parsed.port:
-            if (parsed.scheme == 'http' and parsed.port == 80) or \
-               (parsed.scheme == 'https' and parsed.port == 443):
-                # Reconstruct without port
-                netloc = parsed.hostname
-                if parsed.username or parsed.password:
-                    auth = f"{parsed.username}:{parsed.password}@" if parsed.password else f"{parsed.username}@"
-                    netloc = auth + netloc
-                url = urlunparse((
-                    parsed.scheme,
-                    netloc,
-                    parsed.path,
-                    parsed.params,
-                    parsed.query,
-                    ''  # fragment
-                ))
-        
-        return url
+    # Normalization is memoized per URL string, see normalize_url
+    _normalize_url = staticmethod(normalize_url)
     
-    def _find_fuzzy_match(self, bookmark: Bookmark, candidates: List[Bookmark]) -> Optional[Bookmark]:
+    def _build_match_index(self, bookmarks: List[Bookmark]) -> MatchIndex:
         """
-        Find fuzzy URL match for a bookmark.
+        Build the duplicate-detection maps for a tree in a single pass.
         
-        Handles:
-        - http vs https
-        - www vs non-www
-        - Trailing slash differences
-        - Query parameter differences (optional)
-        """
-        normalized_target = self._normalize_url(bookmark.url)
-        target_parsed = urlparse(normalized_target)
+        For duplicate keys the URL and name+URL maps keep the last bookmark
+        and the fuzzy map keeps the first.
         
-        for candidate in candidates:
-            normalized_candidate = self._normalize_url(candidate.url)
-            candidate_parsed = urlparse(normalized_candidate)
-            
-            # Check if domains match (with www normalization)
-            target_domain = target_parsed.netloc.replace('www.', '')
-            candidate_domain = candidate_parsed.netloc.replace('www.', '')
-            
-            if target_domain != candidate_domain:
-                continue
-            
-            # Check if paths match (normalized)
-            target_path = target_parsed.path.rstrip('/')
-            candidate_path = candidate_parsed.path.rstrip('/')
-            
-            if target_path != candidate_path:
-                continue
+        Args:
+            bookmarks: Bookmarks to index
             
-            # Protocol difference (http vs https) is acceptable for fuzzy match
-            # Query parameters difference is acceptable
-            return candidate
-        
-        return None
+        Returns:
+            MatchIndex over the bookmarks, honoring the enabled match types
+        """
+        index = MatchIndex()
+        url_map = index.url_map
+        name_url_map = index.name_url_map if self.enable_name_matching else None
+        fuzzy_map = index.fuzzy_map if self.enable_fuzzy_matching else None
+        
+        normalized_urls = normalize_urls([bookmark.url for bookmark in bookmarks])
+        for bookmark, normalized_url in zip(bookmarks, normalized_urls):
+            url_map[normalized_url] = bookmark
+            if name_url_map is not None:
+                name_url_map[(bookmark.title.lower(), normalized_url)] = bookmark
+            if fuzzy_map is not None:
+                fuzzy_map.setdefault(_fuzzy_url_key(normalized_url), bookmark)
+        
+        return index
     
     def _urls_are_similar(self, url1: str, url2: str) -> bool:
         """
@@ -401,23 +532,7 @@ class BookmarkMerger:
         if norm1 == norm2:
             return True
         
-        parsed1 = urlparse(norm1)
-        parsed2 = urlparse(norm2)
-        
-        # Compare domains (normalize www)
-        domain1 = parsed1.netloc.replace('www.', '')
-        domain2 = parsed2.netloc.replace('www.', '')
-        
-        if domain1 != domain2:
-            return False
-        
-        # Compare paths (normalize trailing slash)
-        path1 = parsed1.path.rstrip('/')
-        path2 = parsed2.path.rstrip('/')
-        
-        if path1 != path2:
-            return False
-        
+        # Compare domains (normalize www) and paths (normalize trailing slash)
         # Protocol difference (http vs https) is acceptable
         # Query and fragment differences are acceptable for fuzzy match
-        return True
+        return _fuzzy_url_key(norm1) == _fuzzy_url_key(norm2)
@@ -2,7 +2,7 @@
 
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import List, Optional, Union
+from typing import Iterator, List, Optional, Union
 from enum import Enum
 
 
@@ -12,9 +12,12 @@ class BookmarkType(Enum):
     FOLDER = "folder"
 
 
-@dataclass
+@dataclass(slots=True)
 class Bookmark:
     """Represents a bookmark URL."""
+    # Type tag for cheap dispatch in tree walks (not a dataclass field)
+    kind = BookmarkType.URL.value
+    
     title: str
     url: str
     date_added: datetime
@@ -33,12 +36,16 @@ class Bookmark:
         return self.url.lower() == other.url.lower()
 
 
-@dataclass
+@dataclass(slots=True)
 class BookmarkFolder:
     """Represents a bookmark folder containing bookmarks and subfolders."""
+    # Type tag for cheap dispatch in tree walks (not a dataclass field)
+    kind = BookmarkType.FOLDER.value
+    
     name: str
     date_added: datetime
     date_modified: datetime
+    # A list while the tree is built; a tuple after freeze()
     children: List[Union['BookmarkFolder', Bookmark]] = field(default_factory=list)
     
     def add_child(self, child: Union['BookmarkFolder', Bookmark]):
@@ -49,10 +56,11 @@ class BookmarkFolder:
         """Find a bookmark by URL recursively."""
         url_lower = url.lower()
         for child in self.children:
-            if isinstance(child, Bookmark):
+            kind = child.kind
+            if kind == "url":
                 if child.url.lower() == url_lower:
                     return child
-            elif isinstance(child, BookmarkFolder):
+            elif kind == "folder":
                 found = child.find_bookmark_by_url(url)
                 if found:
                     return found
@@ -61,27 +69,47 @@ class BookmarkFolder:
     def find_folder_by_name(self, name: str) -> Optional['BookmarkFolder']:
         """Find a folder by name (non-recursive)."""
         for child in self.children:
-            if isinstance(child, BookmarkFolder) and child.name == name:
+            if child.kind == "folder" and child.name == name:
                 return child
         return None
     
     def get_all_bookmarks(self) -> List[Bookmark]:
-        """Get all bookmarks recursively."""
-        bookmarks = []
-        for child in self.children:
-            if isinstance(child, Bookmark):
-                bookmarks.append(child)
-            elif isinstance(child, BookmarkFolder):
-                bookmarks.extend(child.get_all_bookmarks())
-        return bookmarks
+        """Get all bookmarks in depth-first order."""
+        return list(self.iter_all_bookmarks())
+    
+    def iter_all_bookmarks(self) -> Iterator[Bookmark]:
+        """Iterate over all bookmarks depth-first without building a list."""
+        stack = list(reversed(self.children))
+        while stack:
+            node = stack.pop()
+            kind = node.kind
+            if kind == "url":
+                yield node
+            elif kind == "folder":
+                stack.extend(reversed(node.children))
+    
+    def freeze(self):
+        """
+        Convert this folder's and all subfolders' children to tuples.
+        
+        Use once a tree is complete and will only be read; frozen folders
+        are smaller and faster to iterate, but add_child no longer works.
+        """
+        stack = [self]
+        while stack:
+            folder = stack.pop()
+            folder.children = tuple(folder.children)
+            stack.extend(child for child in folder.children if child.kind == "folder")
     
     def get_all_folders(self) -> List['BookmarkFolder']:
-        """Get all folders recursively."""
+        """Get all folders in depth-first order."""
         folders = []
-        for child in self.children:
-            if isinstance(child, BookmarkFolder):
-                folders.append(child)
-                folders.extend(child.get_all_folders())
+        stack = list(reversed(self.children))
+        while stack:
+            node = stack.pop()
+            if node.kind == "folder":
+                folders.append(node)
+                stack.extend(reversed(node.children))
         return folders
 
 
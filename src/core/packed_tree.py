@@ -0,0 +1,112 @@
+"""Flattened, column-per-field representation of a bookmark tree."""
+
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import List, Optional
+from src.core.models import Bookmark, BookmarkFolder, BookmarkTree
+
+
+@dataclass(slots=True)
+class PackedTree:
+    """
+    Bookmark tree stored as parallel lists in pre-order.
+    
+    Index 0 is the root folder. Each node has an entry in every column;
+    `urls`, `favicons` and `tags` are None for folders, and `names` holds
+    the bookmark title or folder name.
+    """
+    kinds: List[str] = field(default_factory=list)
+    names: List[str] = field(default_factory=list)
+    urls: List[Optional[str]] = field(default_factory=list)
+    date_added: List[datetime] = field(default_factory=list)
+    date_modified: List[datetime] = field(default_factory=list)
+    favicons: List[Optional[str]] = field(default_factory=list)
+    tags: List[Optional[List[str]]] = field(default_factory=list)
+    parents: List[int] = field(default_factory=list)
+    
+    @classmethod
+    def from_tree(cls, root: BookmarkTree) -> 'PackedTree':
+        """
+        Pack a tree with a single pre-order walk.
+        
+        Args:
+            root: Root folder of the tree
+        
+        Returns:
+            PackedTree holding every folder and bookmark under root
+        """
+        packed = cls()
+        kinds = packed.kinds
+        names = packed.names
+        urls = packed.urls
+        date_added = packed.date_added
+        date_modified = packed.date_modified
+        favicons = packed.favicons
+        tags = packed.tags
+        parents = packed.parents
+        
+        stack = [(root, -1)]
+        while stack:
+            node, parent = stack.pop()
+            index = len(kinds)
+            kind = node.kind
+            kinds.append(kind)
+            date_added.append(node.date_added)
+            date_modified.append(node.date_modified)
+            parents.append(parent)
+            if kind == "url":
+                names.append(node.title)
+                urls.append(node.url)
+                favicons.append(node.favicon)
+                tags.append(node.tags)
+            else:
+                names.append(node.name)
+                urls.append(None)
+                favicons.append(None)
+                tags.append(None)
+                stack.extend(
+                    (child, index) for child in reversed(node.children)
+                    if child.kind in ("url", "folder")
+                )
+        return packed
+    
+    def bookmark_indices(self) -> List[int]:
+        """Get the indices of all bookmarks, in depth-first order."""
+        return [i for i, kind in enumerate(self.kinds) if kind == "url"]
+    
+    def to_tree(self) -> BookmarkTree:
+        """
+        Materialize a new tree from the packed columns.
+        
+        Returns:
+            Root folder of a freshly built tree sharing no nodes with the source
+        """
+        nodes: List[BookmarkFolder | Bookmark] = []
+        names = self.names
+        urls = self.urls
+        date_added = self.date_added
+        date_modified = self.date_modified
+        favicons = self.favicons
+        tags = self.tags
+        parents = self.parents
+        
+        for i, kind in enumerate(self.kinds):
+            if kind == "url":
+                node = Bookmark(
+                    title=names[i],
+                    url=urls[i],
+                    date_added=date_added[i],
+                    date_modified=date_modified[i],
+                    favicon=favicons[i],
+                    tags=tags[i].copy() if tags[i] else []
+                )
+            else:
+                node = BookmarkFolder(
+                    name=names[i],
+                    date_added=date_added[i],
+                    date_modified=date_modified[i]
+                )
+            nodes.append(node)
+            if parents[i] >= 0:
+                nodes[parents[i]].children.append(node)
+        return nodes[0]
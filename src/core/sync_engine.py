@@ -1,10 +1,11 @@
 """Sync engine for bidirectional bookmark synchronization."""
 
+import logging
 import os
-import sqlite3
-import json
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
-from typing import Optional
+from itertools import islice
+from typing import Dict, Optional
 from pathlib import Path
 from datetime import datetime
 from src.browsers.base import BrowserAdapter
@@ -14,7 +15,6 @@ from src.core.models import BookmarkTree
 from src.core.merger import BookmarkMerger, MergeStrategy
 from src.core.change_detector import ChangeDetector
 from src.core.sync_metadata import SyncMetadata
-from src.backup.backup_manager import BackupManager
 from src.utils.logger import setup_logger
 from src.utils.validators import is_valid_url
 
@@ -90,12 +90,36 @@ class SyncEngine:
         except FileNotFoundError as e:
             raise BrowserNotFoundError(f"Chrome profile not found: {e}")
         
-        self.merger = BookmarkMerger(merge_strategy)
-        self.backup_manager = BackupManager()
+        # The merger and backup manager are created on first use: one-way
+        # syncs never merge, and syncs without backups never touch the
+        # backup directory or its metadata
+        self.merge_strategy = merge_strategy
+        self._merger: Optional[BookmarkMerger] = None
+        self._backup_manager = None
         self.backup_before_sync = backup_before_sync
         self.sync_mode = sync_mode
+        # Always BLAKE2b: stored hashes must not depend on what happens to be installed
         self.change_detector = ChangeDetector()
         self.metadata = SyncMetadata()
+        
+        # Profile directories don't change for the engine's lifetime
+        self.firefox_path = self.firefox_adapter.get_profile_path()
+        self.chrome_path = self.chrome_adapter.get_profile_path()
+    
+    @property
+    def merger(self) -> BookmarkMerger:
+        """Bookmark merger, created on first use."""
+        if self._merger is None:
+            self._merger = BookmarkMerger(self.merge_strategy)
+        return self._merger
+    
+    @property
+    def backup_manager(self):
+        """Backup manager, created (and its module imported) on first use."""
+        if self._backup_manager is None:
+            from src.backup.backup_manager import BackupManager
+            self._backup_manager = BackupManager()
+        return self._backup_manager
     
     def sync(self, direction: SyncDirection = SyncDirection.BIDIRECTIONAL, 
              dry_run: bool = False) -> bool:
@@ -139,9 +163,13 @@ class SyncEngine:
             return False
         except Exception as e:
             logger.error(f"Sync failed: {e}")
-            import traceback
-            logger.debug(traceback.format_exc())
+            # exc_info defers formatting the traceback until DEBUG is actually enabled
+            logger.debug("Sync failure traceback:", exc_info=True)
             return False
+        finally:
+            # Metadata is saved in the background; make sure it is on disk
+            # before reporting the sync as done
+            self.metadata.flush()
     
     def _validate_browser_access(self):
         """Validate access to browser files."""
@@ -149,17 +177,15 @@ class SyncEngine:
         if self.firefox_adapter.is_locked():
             raise BrowserLockedError("Firefox database is locked. Please close Firefox.")
         
-        firefox_path = self.firefox_adapter.get_profile_path()
-        if not os.access(firefox_path, os.R_OK):
-            raise PermissionError(f"Cannot read Firefox profile: {firefox_path}")
+        if not os.access(self.firefox_path, os.R_OK):
+            raise PermissionError(f"Cannot read Firefox profile: {self.firefox_path}")
         
         # Check Chrome
         if self.chrome_adapter.is_locked():
             raise BrowserLockedError("Chrome Bookmarks file is locked. Please close Chrome.")
         
-        chrome_path = self.chrome_adapter.get_profile_path()
-        if not os.access(chrome_path, os.R_OK):
-            raise PermissionError(f"Cannot read Chrome profile: {chrome_path}")
+        if not os.access(self.chrome_path, os.R_OK):
+            raise PermissionError(f"Cannot read Chrome profile: {self.chrome_path}")
     
     def _validate_bookmark_tree(self, tree: BookmarkTree) -> bool:
         """
@@ -171,9 +197,7 @@ class SyncEngine:
         Returns:
             True if valid, raises CorruptedDataError if invalid
         """
-        bookmarks = tree.get_all_bookmarks()
-        
-        for bookmark in bookmarks:
+        for bookmark in tree.iter_all_bookmarks():
             if not is_valid_url(bookmark.url):
                 raise CorruptedDataError(f"Invalid URL in bookmark: {bookmark.url}")
             
@@ -182,53 +206,78 @@ class SyncEngine:
         
         return True
     
+    def _backup_profiles(self):
+        """
+        Back up both profiles if backups are enabled.
+        
+        Called just before the first write, so syncs that end up writing
+        nothing (dry runs, unchanged sources, failed reads) skip the copies.
+        """
+        if not self.backup_before_sync:
+            return
+        self.backup_manager.backup_firefox(
+            self.firefox_path,
+            self.firefox_profile_name
+        )
+        self.backup_manager.backup_chrome(
+            self.chrome_path,
+            self.chrome_profile_name
+        )
+    
+    def _read_and_validate(self, adapter: BrowserAdapter) -> BookmarkTree:
+        """
+        Read a browser's bookmarks and validate them.
+        
+        Args:
+            adapter: Browser adapter to read from
+            
+        Returns:
+            Validated bookmark tree
+        """
+        tree = adapter.read_bookmarks()
+        self._validate_bookmark_tree(tree)
+        return tree
+    
     def _sync_firefox_to_chrome(self, dry_run: bool = False) -> bool:
         """Sync Firefox bookmarks to Chrome."""
         logger.info(f"Syncing Firefox → Chrome (mode: {self.sync_mode.value})")
         
-        # Backup if enabled
-        if self.backup_before_sync and not dry_run:
-            self.backup_manager.backup_firefox(
-                self.firefox_adapter.get_profile_path(),
-                self.firefox_profile_name
-            )
-            self.backup_manager.backup_chrome(
-                self.chrome_adapter.get_profile_path(),
-                self.chrome_profile_name
-            )
-        
         # Read Firefox bookmarks
         logger.info("Reading Firefox bookmarks...")
         try:
             firefox_tree = self.firefox_adapter.read_bookmarks()
-            self._validate_bookmark_tree(firefox_tree)
+            # Validation and hashing share one walk; the hashes are what
+            # gets stored after a successful write
+            firefox_hashes = self.change_detector.validate_and_hash(firefox_tree, is_valid_url)
         except Exception as e:
             raise CorruptedDataError(f"Failed to read Firefox bookmarks: {e}")
         
         # Handle incremental sync
         if self.sync_mode == SyncMode.INCREMENTAL:
-            return self._sync_incremental_firefox_to_chrome(firefox_tree, dry_run)
+            return self._sync_incremental_firefox_to_chrome(firefox_tree, firefox_hashes, dry_run)
         
         # Full sync
         if dry_run:
             logger.info(f"DRY RUN: Would write {len(firefox_tree.get_all_bookmarks())} bookmarks to Chrome")
             return True
         
+        self._backup_profiles()
+        
         # Write to Chrome
         logger.info("Writing bookmarks to Chrome...")
         try:
             success = self.chrome_adapter.write_bookmarks(firefox_tree)
             
             if success:
-                # Update metadata
-                sync_time = datetime.now()
-                self.metadata.set_last_sync_time("firefox", self.firefox_profile_name, sync_time)
-                self.metadata.set_last_sync_time("chrome", self.chrome_profile_name, sync_time)
-                
-                # Store bookmark hashes
-                hashes = self.change_detector.get_all_bookmark_hashes(firefox_tree)
-                for url, hash_value in hashes.items():
-                    self.metadata.set_bookmark_hash("chrome", self.chrome_profile_name, url, hash_value)
+                # Update metadata (saved once at the end of the batch)
+                with self.metadata.batch():
+                    # One instant for both profiles, formatted once
+                    sync_time = datetime.now().isoformat()
+                    self.metadata.set_last_sync_time("firefox", self.firefox_profile_name, sync_time)
+                    self.metadata.set_last_sync_time("chrome", self.chrome_profile_name, sync_time)
+                    
+                    # Store bookmark hashes
+                    self.metadata.replace_bookmark_hashes("chrome", self.chrome_profile_name, firefox_hashes)
                 
                 logger.info("Successfully synced Firefox → Chrome")
             else:
@@ -238,24 +287,31 @@ class SyncEngine:
         except Exception as e:
             raise CorruptedDataError(f"Failed to write Chrome bookmarks: {e}")
     
-    def _sync_incremental_firefox_to_chrome(self, firefox_tree: BookmarkTree, dry_run: bool) -> bool:
+    def _sync_incremental_firefox_to_chrome(self, firefox_tree: BookmarkTree,
+                                            firefox_hashes: Dict[str, str], dry_run: bool) -> bool:
         """Incremental sync Firefox to Chrome."""
         logger.info("Performing incremental sync...")
         
-        # Get previous Chrome bookmarks state
-        previous_hashes = {}
+        # Get previous Chrome bookmarks state, from the hashes stored by the
+        # last sync when there are any, otherwise by reading Chrome
+        previous_hashes = self.metadata.get_all_bookmark_hashes("chrome", self.chrome_profile_name)
+        if previous_hashes and previous_hashes == firefox_hashes:
+            logger.info("Source unchanged since last sync, nothing to do")
+            return True
         chrome_bookmarks_file = self.chrome_adapter.bookmarks_file
-        if chrome_bookmarks_file.exists():
+        if not previous_hashes and chrome_bookmarks_file.exists():
             try:
-                chrome_tree = self.chrome_adapter.read_bookmarks()
-                previous_hashes = self.change_detector.get_all_bookmark_hashes(chrome_tree)
+                # Only the hashes are needed, so skip building a Chrome tree
+                previous_hashes = self.change_detector.hash_bookmark_fields(
+                    self.chrome_adapter.iter_bookmark_fields()
+                )
             except:
                 logger.warning("Could not read previous Chrome state, performing full sync")
                 previous_hashes = {}
         
         # Detect changes
         new_bookmarks, modified_bookmarks, deleted_urls = self.change_detector.detect_changes(
-            firefox_tree, previous_hashes
+            firefox_tree, previous_hashes, firefox_hashes
         )
         
         if not new_bookmarks and not modified_bookmarks and not deleted_urls:
@@ -269,21 +325,23 @@ class SyncEngine:
             logger.info(f"DRY RUN: Would sync {len(new_bookmarks) + len(modified_bookmarks)} changed bookmarks")
             return True
         
+        self._backup_profiles()
+        
         # For incremental sync, we still write the full tree
         # (browsers don't support partial updates easily)
         # But we track what changed
         success = self.chrome_adapter.write_bookmarks(firefox_tree)
         
         if success:
-            # Update metadata
-            sync_time = datetime.now()
-            self.metadata.set_last_sync_time("firefox", self.firefox_profile_name, sync_time)
-            self.metadata.set_last_sync_time("chrome", self.chrome_profile_name, sync_time)
-            
-            # Store bookmark hashes
-            hashes = self.change_detector.get_all_bookmark_hashes(firefox_tree)
-            for url, hash_value in hashes.items():
-                self.metadata.set_bookmark_hash("chrome", self.chrome_profile_name, url, hash_value)
+            # Update metadata (saved once at the end of the batch)
+            with self.metadata.batch():
+                # One instant for both profiles, formatted once
+                sync_time = datetime.now().isoformat()
+                self.metadata.set_last_sync_time("firefox", self.firefox_profile_name, sync_time)
+                self.metadata.set_last_sync_time("chrome", self.chrome_profile_name, sync_time)
+                
+                # Store bookmark hashes
+                self.metadata.replace_bookmark_hashes("chrome", self.chrome_profile_name, firefox_hashes)
         
         return success
     
@@ -291,49 +349,42 @@ class SyncEngine:
         """Sync Chrome bookmarks to Firefox."""
         logger.info(f"Syncing Chrome → Firefox (mode: {self.sync_mode.value})")
         
-        # Backup if enabled
-        if self.backup_before_sync and not dry_run:
-            self.backup_manager.backup_firefox(
-                self.firefox_adapter.get_profile_path(),
-                self.firefox_profile_name
-            )
-            self.backup_manager.backup_chrome(
-                self.chrome_adapter.get_profile_path(),
-                self.chrome_profile_name
-            )
-        
         # Read Chrome bookmarks
         logger.info("Reading Chrome bookmarks...")
         try:
             chrome_tree = self.chrome_adapter.read_bookmarks()
-            self._validate_bookmark_tree(chrome_tree)
+            # Validation and hashing share one walk; the hashes are what
+            # gets stored after a successful write
+            chrome_hashes = self.change_detector.validate_and_hash(chrome_tree, is_valid_url)
         except Exception as e:
             raise CorruptedDataError(f"Failed to read Chrome bookmarks: {e}")
         
         # Handle incremental sync
         if self.sync_mode == SyncMode.INCREMENTAL:
-            return self._sync_incremental_chrome_to_firefox(chrome_tree, dry_run)
+            return self._sync_incremental_chrome_to_firefox(chrome_tree, chrome_hashes, dry_run)
         
         # Full sync
         if dry_run:
             logger.info(f"DRY RUN: Would write {len(chrome_tree.get_all_bookmarks())} bookmarks to Firefox")
             return True
         
+        self._backup_profiles()
+        
         # Write to Firefox
         logger.info("Writing bookmarks to Firefox...")
         try:
             success = self.firefox_adapter.write_bookmarks(chrome_tree)
             
             if success:
-                # Update metadata
-                sync_time = datetime.now()
-                self.metadata.set_last_sync_time("firefox", self.firefox_profile_name, sync_time)
-                self.metadata.set_last_sync_time("chrome", self.chrome_profile_name, sync_time)
-                
-                # Store bookmark hashes
-                hashes = self.change_detector.get_all_bookmark_hashes(chrome_tree)
-                for url, hash_value in hashes.items():
-                    self.metadata.set_bookmark_hash("firefox", self.firefox_profile_name, url, hash_value)
+                # Update metadata (saved once at the end of the batch)
+                with self.metadata.batch():
+                    # One instant for both profiles, formatted once
+                    sync_time = datetime.now().isoformat()
+                    self.metadata.set_last_sync_time("firefox", self.firefox_profile_name, sync_time)
+                    self.metadata.set_last_sync_time("chrome", self.chrome_profile_name, sync_time)
+                    
+                    # Store bookmark hashes
+                    self.metadata.replace_bookmark_hashes("firefox", self.firefox_profile_name, chrome_hashes)
                 
                 logger.info("Successfully synced Chrome → Firefox")
             else:
@@ -343,22 +394,28 @@ class SyncEngine:
         except Exception as e:
             raise CorruptedDataError(f"Failed to write Firefox bookmarks: {e}")
     
-    def _sync_incremental_chrome_to_firefox(self, chrome_tree: BookmarkTree, dry_run: bool) -> bool:
+    def _sync_incremental_chrome_to_firefox(self, chrome_tree: BookmarkTree,
+                                            chrome_hashes: Dict[str, str], dry_run: bool) -> bool:
         """Incremental sync Chrome to Firefox."""
         logger.info("Performing incremental sync...")
         
-        # Get previous Firefox bookmarks state
-        previous_hashes = {}
-        try:
-            firefox_tree = self.firefox_adapter.read_bookmarks()
-            previous_hashes = self.change_detector.get_all_bookmark_hashes(firefox_tree)
-        except:
-            logger.warning("Could not read previous Firefox state, performing full sync")
-            previous_hashes = {}
+        # Get previous Firefox bookmarks state, from the hashes stored by the
+        # last sync when there are any, otherwise by reading Firefox
+        previous_hashes = self.metadata.get_all_bookmark_hashes("firefox", self.firefox_profile_name)
+        if previous_hashes and previous_hashes == chrome_hashes:
+            logger.info("Source unchanged since last sync, nothing to do")
+            return True
+        if not previous_hashes:
+            try:
+                firefox_tree = self.firefox_adapter.read_bookmarks()
+                previous_hashes = self.change_detector.get_all_bookmark_hashes(firefox_tree)
+            except:
+                logger.warning("Could not read previous Firefox state, performing full sync")
+                previous_hashes = {}
         
         # Detect changes
         new_bookmarks, modified_bookmarks, deleted_urls = self.change_detector.detect_changes(
-            chrome_tree, previous_hashes
+            chrome_tree, previous_hashes, chrome_hashes
         )
         
         if not new_bookmarks and not modified_bookmarks and not deleted_urls:
@@ -372,19 +429,21 @@ class SyncEngine:
             logger.info(f"DRY RUN: Would sync {len(new_bookmarks) + len(modified_bookmarks)} changed bookmarks")
             return True
         
+        self._backup_profiles()
+        
         # Write full tree (browsers don't support partial updates easily)
         success = self.firefox_adapter.write_bookmarks(chrome_tree)
         
         if success:
-            # Update metadata
-            sync_time = datetime.now()
-            self.metadata.set_last_sync_time("firefox", self.firefox_profile_name, sync_time)
-            self.metadata.set_last_sync_time("chrome", self.chrome_profile_name, sync_time)
-            
-            # Store bookmark hashes
-            hashes = self.change_detector.get_all_bookmark_hashes(chrome_tree)
-            for url, hash_value in hashes.items():
-                self.metadata.set_bookmark_hash("firefox", self.firefox_profile_name, url, hash_value)
+            # Update metadata (saved once at the end of the batch)
+            with self.metadata.batch():
+                # One instant for both profiles, formatted once
+                sync_time = datetime.now().isoformat()
+                self.metadata.set_last_sync_time("firefox", self.firefox_profile_name, sync_time)
+                self.metadata.set_last_sync_time("chrome", self.chrome_profile_name, sync_time)
+                
+                # Store bookmark hashes
+                self.metadata.replace_bookmark_hashes("firefox", self.firefox_profile_name, chrome_hashes)
         
         return success
     
@@ -392,51 +451,42 @@ class SyncEngine:
         """Sync bookmarks bidirectionally with merge."""
         logger.info("Syncing Firefox ↔ Chrome (bidirectional merge)")
         
-        # Check if browsers are locked
-        if self.firefox_adapter.is_locked():
-            logger.error("Firefox is running. Please close Firefox and try again.")
-            return False
-        
-        if self.chrome_adapter.is_locked():
-            logger.error("Chrome is running. Please close Chrome and try again.")
-            return False
+        # Lock checks already ran in sync() via _validate_browser_access
         
-        # Backup if enabled
-        if self.backup_before_sync and not dry_run:
-            self.backup_manager.backup_firefox(
-                self.firefox_adapter.get_profile_path(),
-                self.firefox_profile_name
-            )
-            self.backup_manager.backup_chrome(
-                self.chrome_adapter.get_profile_path(),
-                self.chrome_profile_name
-            )
-        
-        # Read both
+        # Read both concurrently; the reads are independent and mostly I/O
         logger.info("Reading Firefox bookmarks...")
-        try:
-            firefox_tree = self.firefox_adapter.read_bookmarks()
-            self._validate_bookmark_tree(firefox_tree)
-        except Exception as e:
-            raise CorruptedDataError(f"Failed to read Firefox bookmarks: {e}")
-        
         logger.info("Reading Chrome bookmarks...")
-        try:
-            chrome_tree = self.chrome_adapter.read_bookmarks()
-            self._validate_bookmark_tree(chrome_tree)
-        except Exception as e:
-            raise CorruptedDataError(f"Failed to read Chrome bookmarks: {e}")
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            firefox_future = executor.submit(self._read_and_validate, self.firefox_adapter)
+            chrome_future = executor.submit(self._read_and_validate, self.chrome_adapter)
+            
+            try:
+                firefox_tree = firefox_future.result()
+            except Exception as e:
+                raise CorruptedDataError(f"Failed to read Firefox bookmarks: {e}")
+            
+            try:
+                chrome_tree = chrome_future.result()
+            except Exception as e:
+                raise CorruptedDataError(f"Failed to read Chrome bookmarks: {e}")
         
         # Merge
         logger.info(f"Merging bookmarks using {self.merger.strategy.value} strategy...")
+        # The source trees are only needed afterwards for dry-run reporting,
+        # so a real sync lets the merge reuse their nodes instead of copying
         merged_tree = self.merger.merge(
             firefox_tree,
             chrome_tree,
             "Firefox",
-            "Chrome"
+            "Chrome",
+            take_ownership=not dry_run
         )
+        # Only read from here on (counted, written, hashed)
+        merged_tree.freeze()
         
-        logger.info(f"Merged tree contains {len(merged_tree.get_all_bookmarks())} bookmarks")
+        # Counted once; the tree doesn't change from here on
+        merged_count = len(merged_tree.get_all_bookmarks())
+        logger.info(f"Merged tree contains {merged_count} bookmarks")
         
         # Report conflicts and duplicates
         conflicts = self.merger.get_conflicts()
@@ -449,45 +499,66 @@ class SyncEngine:
         
         if duplicates:
             logger.info(f"Found {len(duplicates)} duplicate match(es)")
-            for b1, b2, match_type in duplicates[:5]:  # Show first 5
-                logger.debug(f"  Duplicate ({match_type}): {b1.url}")
+            if logger.isEnabledFor(logging.DEBUG):
+                for b1, b2, match_type in islice(duplicates, 5):  # Show first 5
+                    logger.debug(f"  Duplicate ({match_type}): {b1.url}")
         
         if dry_run:
-            logger.info(f"DRY RUN: Would write {len(merged_tree.get_all_bookmarks())} bookmarks to both browsers")
-            logger.info(f"  Firefox: {len(firefox_tree.get_all_bookmarks())} → {len(merged_tree.get_all_bookmarks())}")
-            logger.info(f"  Chrome: {len(chrome_tree.get_all_bookmarks())} → {len(merged_tree.get_all_bookmarks())}")
+            logger.info(f"DRY RUN: Would write {merged_count} bookmarks to both browsers")
+            logger.info(f"  Firefox: {len(firefox_tree.get_all_bookmarks())} → {merged_count}")
+            logger.info(f"  Chrome: {len(chrome_tree.get_all_bookmarks())} → {merged_count}")
             return True
         
-        # Write to both
-        logger.info("Writing merged bookmarks to Chrome...")
-        try:
-            chrome_success = self.chrome_adapter.write_bookmarks(merged_tree)
-        except Exception as e:
-            raise CorruptedDataError(f"Failed to write Chrome bookmarks: {e}")
+        self._backup_profiles()
         
+        # Write to both concurrently; they touch different files and only
+        # read the (frozen) merged tree
+        logger.info("Writing merged bookmarks to Chrome...")
         logger.info("Writing merged bookmarks to Firefox...")
-        try:
-            firefox_success = self.firefox_adapter.write_bookmarks(merged_tree)
-        except Exception as e:
-            raise CorruptedDataError(f"Failed to write Firefox bookmarks: {e}")
+        written: Dict[str, bool] = {}
+        errors: Dict[str, str] = {}
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            futures = {
+                "Chrome": executor.submit(self.chrome_adapter.write_bookmarks, merged_tree),
+                "Firefox": executor.submit(self.firefox_adapter.write_bookmarks, merged_tree),
+            }
+            # Wait for both before judging either, so one side failing can't
+            # hide the other side's failure (or the fact that it did write)
+            for browser, future in futures.items():
+                try:
+                    written[browser] = future.result()
+                except Exception as e:
+                    logger.error(f"Failed to write {browser} bookmarks: {e}")
+                    errors[browser] = f"Failed to write {browser} bookmarks: {e}"
+                    written[browser] = False
+        chrome_success = written["Chrome"]
+        firefox_success = written["Firefox"]
+        
+        if chrome_success or firefox_success:
+            # Record every profile that now holds the merged tree, even if the
+            # other write failed (saved once at the end of the batch)
+            with self.metadata.batch():
+                # One instant for both profiles, formatted once
+                sync_time = datetime.now().isoformat()
+                hashes = self.change_detector.get_all_bookmark_hashes(merged_tree)
+                if firefox_success:
+                    self.metadata.set_last_sync_time("firefox", self.firefox_profile_name, sync_time)
+                    self.metadata.replace_bookmark_hashes("firefox", self.firefox_profile_name, hashes)
+                if chrome_success:
+                    self.metadata.set_last_sync_time("chrome", self.chrome_profile_name, sync_time)
+                    self.metadata.replace_bookmark_hashes("chrome", self.chrome_profile_name, hashes)
         
         if chrome_success and firefox_success:
-            # Update metadata
-            sync_time = datetime.now()
-            self.metadata.set_last_sync_time("firefox", self.firefox_profile_name, sync_time)
-            self.metadata.set_last_sync_time("chrome", self.chrome_profile_name, sync_time)
-            
-            # Store bookmark hashes
-            hashes = self.change_detector.get_all_bookmark_hashes(merged_tree)
-            for url, hash_value in hashes.items():
-                self.metadata.set_bookmark_hash("firefox", self.firefox_profile_name, url, hash_value)
-                self.metadata.set_bookmark_hash("chrome", self.chrome_profile_name, url, hash_value)
-            
             logger.info("Successfully synced Firefox ↔ Chrome")
             return True
-        elif chrome_success:
-            logger.warning("Chrome sync succeeded, but Firefox sync failed")
-            return False
+        
+        if chrome_success or firefox_success:
+            done, failed = ("Chrome", "Firefox") if chrome_success else ("Firefox", "Chrome")
+            summary = f"{done} was written with the merged bookmarks, but the {failed} write failed"
         else:
-            logger.error("Failed to sync to both browsers")
-            return False
+            summary = "Failed to sync to both browsers"
+        
+        if errors:
+            raise CorruptedDataError(f"{summary}: {'; '.join(errors.values())}")
+        logger.error(summary)
+        return False
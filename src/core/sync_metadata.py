@@ -1,9 +1,13 @@
 """Sync metadata tracking for incremental sync."""
 
-import json
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, Optional
+from typing import Dict, Iterator, Optional, Tuple, Union
+from src.utils import json_io
 from src.utils.logger import setup_logger
 
 logger = setup_logger()
@@ -20,26 +24,107 @@ class SyncMetadata:
             metadata_file: Path to metadata file
         """
         self.metadata_file = metadata_file
-        self.metadata: Dict = self._load_metadata()
+        # Kept flat in memory, keyed by (source, profile); the nested
+        # "source:profile" JSON shape is only built when saving
+        self._times: Dict[Tuple[str, str], str] = {}
+        self._hashes: Dict[Tuple[str, str], Dict[str, str]] = {}
+        self._load_metadata()
+        # While a batch is open, saves are deferred until it closes
+        self._in_batch = False
+        self._dirty = False
+        # File writes happen on a single background thread. Only the latest
+        # snapshot waiting to be written is kept, so bursts of saves coalesce.
+        self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="sync-metadata")
+        self._pending_lock = threading.Lock()
+        self._pending: Optional[bytes] = None
     
-    def _load_metadata(self) -> Dict:
-        """Load metadata from file."""
-        if self.metadata_file.exists():
-            try:
-                with open(self.metadata_file, 'r') as f:
-                    return json.load(f)
-            except Exception as e:
-                logger.warning(f"Failed to load sync metadata: {e}")
-                return {}
-        return {}
+    def _load_metadata(self):
+        """Load metadata from file into the flat in-memory tables."""
+        if not self.metadata_file.exists():
+            return
+        try:
+            data = json_io.loads(self.metadata_file.read_bytes())
+        except Exception as e:
+            logger.warning(f"Failed to load sync metadata: {e}")
+            return
+        
+        for key, entry in data.items():
+            source, _, profile = key.partition(":")
+            if "last_sync" in entry:
+                self._times[(source, profile)] = entry["last_sync"]
+            if "bookmarks" in entry:
+                self._hashes[(source, profile)] = entry["bookmarks"]
+    
+    def _to_json_shape(self) -> Dict:
+        """Build the on-disk {"source:profile": {...}} mapping from the flat tables."""
+        data = {}
+        for source, profile in dict.fromkeys([*self._times, *self._hashes]):
+            entry = {}
+            if (source, profile) in self._times:
+                entry["last_sync"] = self._times[(source, profile)]
+            if (source, profile) in self._hashes:
+                entry["bookmarks"] = self._hashes[(source, profile)]
+            data[f"{source}:{profile}"] = entry
+        return data
+    
+    @contextmanager
+    def batch(self) -> Iterator['SyncMetadata']:
+        """
+        Defer saving until the block exits, so several updates cost one write.
+        
+        Yields:
+            This SyncMetadata instance
+        """
+        if self._in_batch:
+            # Nested batch: the outermost one saves
+            yield self
+            return
+        self._in_batch = True
+        try:
+            yield self
+        finally:
+            self._in_batch = False
+            if self._dirty:
+                self._save_metadata()
     
     def _save_metadata(self):
-        """Save metadata to file."""
+        """Save metadata to file (deferred while a batch is open)."""
+        if self._in_batch:
+            self._dirty = True
+            return
+        self._dirty = False
         try:
-            with open(self.metadata_file, 'w') as f:
-                json.dump(self.metadata, f, indent=2, default=str)
+            # Snapshot now; later changes must not leak into this write
+            payload = json_io.dumps(self._to_json_shape())
         except Exception as e:
             logger.error(f"Failed to save sync metadata: {e}")
+            return
+        
+        with self._pending_lock:
+            already_scheduled = self._pending is not None
+            self._pending = payload
+        if not already_scheduled:
+            self._writer.submit(self._write_pending)
+    
+    def _write_pending(self):
+        """Write the latest pending snapshot to file (runs on the writer thread)."""
+        with self._pending_lock:
+            payload, self._pending = self._pending, None
+        if payload is None:
+            return
+        
+        # Write a temp file and swap it in, so a crash mid-write can't leave
+        # a truncated metadata file behind
+        tmp_file = self.metadata_file.with_suffix(".json.tmp")
+        try:
+            tmp_file.write_bytes(payload)
+            os.replace(tmp_file, self.metadata_file)
+        except Exception as e:
+            logger.error(f"Failed to save sync metadata: {e}")
+    
+    def flush(self):
+        """Block until every save requested so far has been written to file."""
+        self._writer.submit(lambda: None).result()
     
     def get_last_sync_time(self, source: str, profile: str) -> Optional[datetime]:
         """
@@ -52,8 +137,7 @@ class SyncMetadata:
         Returns:
             Last sync datetime or None
         """
-        key = f"{source}:{profile}"
-        timestamp = self.metadata.get(key, {}).get("last_sync")
+        timestamp = self._times.get((source, profile))
         if timestamp:
             try:
                 return datetime.fromisoformat(timestamp)
@@ -61,19 +145,20 @@ class SyncMetadata:
                 return None
         return None
     
-    def set_last_sync_time(self, source: str, profile: str, sync_time: datetime):
+    def set_last_sync_time(self, source: str, profile: str, sync_time: Union[datetime, str]):
         """
         Set last sync time for a source/profile.
         
         Args:
             source: 'firefox' or 'chrome'
             profile: Profile name
-            sync_time: Sync datetime
+            sync_time: Sync datetime, or an already formatted ISO 8601 string
         """
-        key = f"{source}:{profile}"
-        if key not in self.metadata:
-            self.metadata[key] = {}
-        self.metadata[key]["last_sync"] = sync_time.isoformat()
+        key = (source, profile)
+        timestamp = sync_time if isinstance(sync_time, str) else sync_time.isoformat()
+        if self._times.get(key) == timestamp:
+            return  # Unchanged, skip rewriting the file
+        self._times[key] = timestamp
         self._save_metadata()
     
     def get_bookmark_hash(self, source: str, profile: str, url: str) -> Optional[str]:
@@ -88,9 +173,20 @@ class SyncMetadata:
         Returns:
             Stored hash or None
         """
-        key = f"{source}:{profile}"
-        bookmarks = self.metadata.get(key, {}).get("bookmarks", {})
-        return bookmarks.get(url)
+        return self._hashes.get((source, profile), {}).get(url)
+    
+    def get_all_bookmark_hashes(self, source: str, profile: str) -> Dict[str, str]:
+        """
+        Get all stored bookmark hashes for a source/profile.
+        
+        Args:
+            source: 'firefox' or 'chrome'
+            profile: Profile name
+            
+        Returns:
+            Copy of the URL -> hash mapping (empty if nothing is stored)
+        """
+        return dict(self._hashes.get((source, profile), {}))
     
     def set_bookmark_hash(self, source: str, profile: str, url: str, hash_value: str):
         """
@@ -102,12 +198,28 @@ class SyncMetadata:
             url: Bookmark URL
             hash_value: Hash of bookmark data
         """
-        key = f"{source}:{profile}"
-        if key not in self.metadata:
-            self.metadata[key] = {}
-        if "bookmarks" not in self.metadata[key]:
-            self.metadata[key]["bookmarks"] = {}
-        self.metadata[key]["bookmarks"][url] = hash_value
+        bookmarks = self._hashes.setdefault((source, profile), {})
+        if bookmarks.get(url) == hash_value:
+            return  # Unchanged, skip rewriting the file
+        bookmarks[url] = hash_value
+        self._save_metadata()
+    
+    def replace_bookmark_hashes(self, source: str, profile: str, hashes: Dict[str, str]):
+        """
+        Replace all stored hashes for a source/profile with a single save.
+        
+        URLs missing from hashes are dropped, so the table always mirrors the
+        bookmarks last written to the profile.
+        
+        Args:
+            source: 'firefox' or 'chrome'
+            profile: Profile name
+            hashes: Mapping of bookmark URL to hash of bookmark data
+        """
+        key = (source, profile)
+        if self._hashes.get(key) == hashes:
+            return  # Unchanged, skip rewriting the file
+        self._hashes[key] = dict(hashes)
         self._save_metadata()
     
     def clear_metadata(self, source: Optional[str] = None, profile: Optional[str] = None):
@@ -118,16 +230,14 @@ class SyncMetadata:
             source: 'firefox' or 'chrome' (None for all)
             profile: Profile name (None for all profiles of source)
         """
-        if source is None:
-            self.metadata = {}
-        elif profile is None:
-            # Clear all profiles for source
-            keys_to_remove = [k for k in self.metadata.keys() if k.startswith(f"{source}:")]
-            for key in keys_to_remove:
-                del self.metadata[key]
-        else:
-            key = f"{source}:{profile}"
-            if key in self.metadata:
-                del self.metadata[key]
+        for table in (self._times, self._hashes):
+            if source is None:
+                table.clear()
+            elif profile is None:
+                # Clear all profiles for source
+                for key in [k for k in table if k[0] == source]:
+                    del table[key]
+            else:
+                table.pop((source, profile), None)
         
         self._save_metadata()
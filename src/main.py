@@ -2,45 +2,71 @@
 """CLI interface for bookmark sync."""
 
 import argparse
-import json
+import os
 import sys
+from functools import lru_cache
 from pathlib import Path
-from src.core.sync_engine import SyncEngine, SyncDirection, SyncMode
+from typing import Optional
 from src.core.merger import MergeStrategy
-from src.backup.backup_manager import BackupManager
-from src.backup.restore_manager import RestoreManager
-from src.utils.paths import get_firefox_profiles, get_chrome_profiles
 from src.utils.logger import setup_logger
-from src.ui.interactive import interactive_sync, interactive_config_wizard
-from src.ui.progress import ProgressTracker
+from src.utils import json_io
+
+# The sync engine, backup and UI modules are imported inside the commands
+# that use them, so --help and the listing commands don't load the browser
+# adapters and everything behind them
 
 logger = setup_logger()
 
+# Valid --merge-strategy values, enumerated once for the parsers and checks
+_MERGE_STRATEGY_VALUES = tuple(s.value for s in MergeStrategy)
+
+# Parsed config per (path, mtime in ns); an edited file gets a new key
+_CONFIG_CACHE = {}
+
 
 def load_config() -> dict:
-    """Load configuration from config.json."""
+    """Load configuration from config.json (parsed once per file version)."""
     config_file = Path("config.json")
-    if config_file.exists():
-        try:
-            with open(config_file, 'r') as f:
-                return json.load(f)
-        except Exception as e:
-            logger.warning(f"Failed to load config: {e}")
-    return {}
+    try:
+        stat = config_file.stat()
+    except OSError:
+        return {}
+    
+    key = (str(config_file.absolute()), stat.st_mtime_ns)
+    if key in _CONFIG_CACHE:
+        return _CONFIG_CACHE[key]
+    
+    try:
+        config = json_io.loads(config_file.read_bytes())
+    except Exception as e:
+        logger.warning(f"Failed to load config: {e}")
+        return {}
+    
+    _CONFIG_CACHE.clear()  # Older versions of the file won't be asked for again
+    _CONFIG_CACHE[key] = config
+    return config
 
 
 def save_config(config: dict):
     """Save configuration to config.json."""
     config_file = Path("config.json")
     try:
-        with open(config_file, 'w') as f:
-            json.dump(config, f, indent=2)
+        config_file.write_bytes(json_io.dumps(config))
     except Exception as e:
         logger.error(f"Failed to save config: {e}")
 
 
+@lru_cache(maxsize=None)
+def _sync_mode_values() -> tuple:
+    """Valid sync mode values (SyncMode is only imported once a command needs it)."""
+    from src.core.sync_engine import SyncMode
+    return tuple(s.value for s in SyncMode)
+
+
 def cmd_sync(args):
     """Handle sync command."""
+    from src.core.sync_engine import SyncEngine, SyncDirection, SyncMode
+    
     config = load_config()
     
     firefox_profile = args.firefox_profile or config.get("firefox", {}).get("profile")
@@ -48,21 +74,19 @@ def cmd_sync(args):
     
     # Determine merge strategy
     merge_strategy_name = args.merge_strategy or config.get("sync", {}).get("merge_strategy", "keep_all")
-    try:
-        merge_strategy = MergeStrategy(merge_strategy_name)
-    except ValueError:
+    if merge_strategy_name not in _MERGE_STRATEGY_VALUES:
         logger.error(f"Invalid merge strategy: {merge_strategy_name}")
-        logger.info(f"Available strategies: {[s.value for s in MergeStrategy]}")
+        logger.info(f"Available strategies: {list(_MERGE_STRATEGY_VALUES)}")
         return 1
+    merge_strategy = MergeStrategy(merge_strategy_name)
     
     # Determine sync mode
     sync_mode_name = args.sync_mode or config.get("sync", {}).get("sync_mode", "full")
-    try:
-        sync_mode = SyncMode(sync_mode_name)
-    except ValueError:
+    if sync_mode_name not in _sync_mode_values():
         logger.error(f"Invalid sync mode: {sync_mode_name}")
-        logger.info(f"Available modes: {[s.value for s in SyncMode]}")
+        logger.info(f"Available modes: {list(_sync_mode_values())}")
         return 1
+    sync_mode = SyncMode(sync_mode_name)
     
     # Determine sync direction
     if args.from_browser and args.to_browser:
@@ -98,17 +122,18 @@ def cmd_sync(args):
 
 def cmd_merge(args):
     """Handle merge command."""
+    from src.core.sync_engine import SyncEngine, SyncDirection, SyncMode
+    
     config = load_config()
     
     firefox_profile = args.firefox_profile or config.get("firefox", {}).get("profile")
     chrome_profile = args.chrome_profile or config.get("chrome", {}).get("profile")
     
     merge_strategy_name = args.strategy or config.get("sync", {}).get("merge_strategy", "keep_all")
-    try:
-        merge_strategy = MergeStrategy(merge_strategy_name)
-    except ValueError:
+    if merge_strategy_name not in _MERGE_STRATEGY_VALUES:
         logger.error(f"Invalid merge strategy: {merge_strategy_name}")
         return 1
+    merge_strategy = MergeStrategy(merge_strategy_name)
     
     try:
         engine = SyncEngine(
@@ -130,6 +155,8 @@ def cmd_merge(args):
 
 def cmd_backup(args):
     """Handle backup command."""
+    from src.backup.backup_manager import BackupManager
+    
     backup_manager = BackupManager()
     
     if args.source:
@@ -187,6 +214,9 @@ def cmd_backup(args):
 
 def cmd_restore(args):
     """Handle restore command."""
+    from src.backup.backup_manager import BackupManager
+    from src.backup.restore_manager import RestoreManager
+    
     backup_manager = BackupManager()
     restore_manager = RestoreManager(backup_manager)
     
@@ -195,33 +225,22 @@ def cmd_restore(args):
     
     # List backups if requested
     if args.list:
-        backups = backup_manager.list_backups(source=args.source)
-        if not backups:
+        total = backup_manager.count_backups(source=args.source)
+        if not total:
             logger.info("No backups found")
             if args.source:
                 logger.info(f"Filtered by source: {args.source}")
             return 0
+        backups = backup_manager.list_backups(source=args.source, limit=args.limit or None,
+                                              offset=args.offset)
         
         print(f"{'='*70}")
         print("AVAILABLE BACKUPS")
         print(f"{'='*70}\n")
         
-        for i, backup in enumerate(backups, 1):
-            timestamp = backup.get('timestamp', 'Unknown')
-            source = backup.get('source', 'unknown')
-            profile = backup.get('profile', 'unknown')
-            file = backup.get('file', 'unknown')
-            size = backup.get('size', 0)
-            size_mb = size / (1024 * 1024) if size else 0
-            
-            print(f"{i}. {source.upper()} - {profile}")
-            print(f"   File: {file}")
-            print(f"   Date: {timestamp}")
-            print(f"   Size: {size_mb:.2f} MB")
-            print(f"   Path: {backup.get('path', 'N/A')}")
-            print()
+        _write_backup_entries(backups, args.offset + 1)
         
-        print(f"Total: {len(backups)} backup(s)")
+        _print_listing_total(len(backups), total, args.offset)
         print(f"\nTo restore, use:")
         print(f"  python3 -m src.main restore --interactive")
         print(f"  python3 -m src.main restore --latest --source firefox")
@@ -232,7 +251,8 @@ def cmd_restore(args):
     if args.interactive:
         from src.ui.interactive import prompt_choice
         
-        backups = backup_manager.list_backups(source=args.source)
+        backups = backup_manager.list_backups(source=args.source, limit=args.limit or None,
+                                              offset=args.offset)
         if not backups:
             logger.error("No backups found")
             return 1
@@ -275,13 +295,11 @@ def cmd_restore(args):
             logger.info("\nUse 'python3 -m src.main restore --list' to see available backups")
             return 1
         
-        # Try to find backup in metadata
+        # Try to find backup in metadata; paths are compared as normalized
+        # absolute strings, so one dict lookup replaces a scan over Path objects
         backups = backup_manager.list_backups()
-        matching_backup = None
-        for backup in backups:
-            if Path(backup['path']) == backup_path:
-                matching_backup = backup
-                break
+        by_path = {os.path.abspath(backup['path']): backup for backup in backups}
+        matching_backup = by_path.get(os.path.abspath(backup_path))
         
         if matching_backup:
             source = matching_backup['source']
@@ -350,6 +368,8 @@ def cmd_restore(args):
 
 def cmd_list_profiles(args):
     """Handle list-profiles command."""
+    from src.utils.paths import get_firefox_profiles, get_chrome_profiles
+    
     print("\n=== Firefox Profiles ===")
     firefox_profiles = get_firefox_profiles()
     if firefox_profiles:
@@ -374,12 +394,50 @@ def cmd_list_profiles(args):
     return 0
 
 
+def _write_backup_entries(backups: list, start: int, profile_label: str = ""):
+    """
+    Write numbered backup entries to stdout in a single write.
+    
+    Args:
+        backups: Backup metadata dicts to list
+        start: Number shown for the first entry
+        profile_label: Text shown before the profile name
+    """
+    entries = []
+    for i, backup in enumerate(backups, start):
+        source = backup.get('source', 'unknown')
+        size = backup.get('size', 0)
+        size_mb = size / (1024 * 1024) if size else 0
+        entries.append(
+            f"{i}. {source.upper()} - {profile_label}{backup.get('profile', 'unknown')}\n"
+            f"   File: {backup.get('file', 'unknown')}\n"
+            f"   Date: {backup.get('timestamp', 'Unknown')}\n"
+            f"   Size: {size_mb:.2f} MB\n"
+            f"   Path: {backup.get('path', 'N/A')}\n\n"
+        )
+    sys.stdout.write("".join(entries))
+    sys.stdout.flush()
+
+
+def _print_listing_total(shown: int, total: int, offset: int):
+    """Print the footer of a backup listing, noting when it is one page of many."""
+    if shown == total:
+        print(f"Total: {total} backup(s)")
+    elif shown:
+        print(f"Showing {offset + 1}-{offset + shown} of {total} backup(s) "
+              f"(use --offset/--limit to see others)")
+    else:
+        print(f"No backups at offset {offset} (total: {total} backup(s))")
+
+
 def cmd_list_backups(args):
     """Handle list-backups command."""
+    from src.backup.backup_manager import BackupManager
+    
     backup_manager = BackupManager()
-    backups = backup_manager.list_backups(source=args.source)
+    total = backup_manager.count_backups(source=args.source)
     
-    if not backups:
+    if not total:
         print("No backups found")
         if args.source:
             print(f"Filtered by source: {args.source}")
@@ -391,23 +449,11 @@ def cmd_list_backups(args):
     print(f"{'='*70}\n")
     print(f"📁 Backup directory: {backup_manager.backup_dir.absolute()}\n")
     
-    for i, backup in enumerate(backups, 1):
-        timestamp = backup.get('timestamp', 'Unknown')
-        source = backup.get('source', 'unknown')
-        profile = backup.get('profile', 'unknown')
-        file = backup.get('file', 'unknown')
-        size = backup.get('size', 0)
-        size_mb = size / (1024 * 1024) if size else 0
-        path = backup.get('path', 'N/A')
-        
-        print(f"{i}. {source.upper()} - Profile: {profile}")
-        print(f"   File: {file}")
-        print(f"   Date: {timestamp}")
-        print(f"   Size: {size_mb:.2f} MB")
-        print(f"   Path: {path}")
-        print()
-    
-    print(f"Total: {len(backups)} backup(s)")
+    backups = backup_manager.list_backups(source=args.source, limit=args.limit or None,
+                                          offset=args.offset)
+    _write_backup_entries(backups, args.offset + 1, profile_label="Profile: ")
+    
+    _print_listing_total(len(backups), total, args.offset)
     print(f"\nTo restore a backup:")
     print(f"  python3 -m src.main restore --interactive")
     print(f"  python3 -m src.main restore --latest --source <firefox|chrome>")
@@ -416,59 +462,83 @@ def cmd_list_backups(args):
     return 0
 
 
-def main():
-    """Main entry point."""
-    parser = argparse.ArgumentParser(
-        description="Sync bookmarks between Firefox and Chrome",
-        formatter_class=argparse.RawDescriptionHelpFormatter
-    )
-    
-    parser.add_argument('--interactive', '-i', action='store_true',
-                       help='Run in interactive mode')
-    parser.add_argument('--gui', action='store_true',
-                       help='Run GUI interface')
-    parser.add_argument('--config-wizard', action='store_true',
-                       help='Run configuration wizard')
-    
-    subparsers = parser.add_subparsers(dest='command', help='Command to execute')
-    
-    # Sync command
-    sync_parser = subparsers.add_parser('sync', help='Sync bookmarks')
+@lru_cache(maxsize=None)
+def _profile_options() -> argparse.ArgumentParser:
+    """Parent parser with the --firefox-profile/--chrome-profile options."""
+    parser = argparse.ArgumentParser(add_help=False)
+    parser.add_argument('--firefox-profile', help='Firefox profile name')
+    parser.add_argument('--chrome-profile', help='Chrome profile name')
+    return parser
+
+
+@lru_cache(maxsize=None)
+def _write_options() -> argparse.ArgumentParser:
+    """Parent parser with the --dry-run/--no-backup options."""
+    parser = argparse.ArgumentParser(add_help=False)
+    parser.add_argument('--dry-run', action='store_true',
+                        help='Preview changes without applying')
+    parser.add_argument('--no-backup', action='store_true',
+                        help='Skip backup before sync')
+    return parser
+
+
+def _non_negative_int(value: str) -> int:
+    """Argparse type for counts; negative values would slice from the wrong end."""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {value!r}")
+    if number < 0:
+        raise argparse.ArgumentTypeError(f"must be 0 or greater, got {number}")
+    return number
+
+
+@lru_cache(maxsize=None)
+def _paging_options() -> argparse.ArgumentParser:
+    """Parent parser with the --limit/--offset listing options."""
+    parser = argparse.ArgumentParser(add_help=False)
+    parser.add_argument('--limit', type=_non_negative_int, default=50,
+                        help='Maximum number of backups to list (0 for all, default: 50)')
+    parser.add_argument('--offset', type=_non_negative_int, default=0,
+                        help='Number of newest backups to skip when listing')
+    return parser
+
+
+def _add_sync_parser(subparsers, help_text: str):
+    """Add the sync command and its options."""
+    sync_parser = subparsers.add_parser('sync', help=help_text,
+                                        parents=[_profile_options(), _write_options()])
     sync_parser.add_argument('--from', dest='from_browser', choices=['firefox', 'chrome'],
                             help='Source browser')
     sync_parser.add_argument('--to', dest='to_browser', choices=['firefox', 'chrome'],
                             help='Target browser')
-    sync_parser.add_argument('--firefox-profile', help='Firefox profile name')
-    sync_parser.add_argument('--chrome-profile', help='Chrome profile name')
-    sync_parser.add_argument('--merge-strategy', choices=[s.value for s in MergeStrategy],
+    sync_parser.add_argument('--merge-strategy', choices=_MERGE_STRATEGY_VALUES,
                             help='Merge strategy for bidirectional sync')
-    sync_parser.add_argument('--sync-mode', choices=[s.value for s in SyncMode],
+    # Only built when the sync command runs, which imports SyncMode anyway
+    sync_parser.add_argument('--sync-mode', choices=_sync_mode_values(),
                             help='Sync mode: full (replace all), incremental (only changes), merge (combine both)')
-    sync_parser.add_argument('--dry-run', action='store_true',
-                            help='Preview changes without applying')
-    sync_parser.add_argument('--no-backup', action='store_true',
-                            help='Skip backup before sync')
-    
-    # Merge command
-    merge_parser = subparsers.add_parser('merge', help='Merge bookmarks from both browsers')
-    merge_parser.add_argument('--strategy', choices=[s.value for s in MergeStrategy],
+
+
+def _add_merge_parser(subparsers, help_text: str):
+    """Add the merge command and its options."""
+    merge_parser = subparsers.add_parser('merge', help=help_text,
+                                         parents=[_profile_options(), _write_options()])
+    merge_parser.add_argument('--strategy', choices=_MERGE_STRATEGY_VALUES,
                              help='Merge strategy')
-    merge_parser.add_argument('--firefox-profile', help='Firefox profile name')
-    merge_parser.add_argument('--chrome-profile', help='Chrome profile name')
-    merge_parser.add_argument('--dry-run', action='store_true',
-                             help='Preview changes without applying')
-    merge_parser.add_argument('--no-backup', action='store_true',
-                             help='Skip backup before sync')
-    
-    # Backup command
-    backup_parser = subparsers.add_parser('backup', help='Backup bookmarks')
+
+
+def _add_backup_parser(subparsers, help_text: str):
+    """Add the backup command and its options."""
+    backup_parser = subparsers.add_parser('backup', help=help_text,
+                                          parents=[_profile_options()])
     backup_parser.add_argument('--source', choices=['firefox', 'chrome'],
                               help='Browser to backup (default: both)')
-    backup_parser.add_argument('--firefox-profile', help='Firefox profile name')
-    backup_parser.add_argument('--chrome-profile', help='Chrome profile name')
-    
-    # Restore command
-    restore_parser = subparsers.add_parser('restore', help='Restore from backup')
+
+
+def _add_restore_parser(subparsers, help_text: str):
+    """Add the restore command and its options."""
+    restore_parser = subparsers.add_parser('restore', help=help_text,
+                                           parents=[_profile_options(), _paging_options()])
     restore_parser.add_argument('backup_file', nargs='?', help='Path to backup file (or use --list to choose)')
     restore_parser.add_argument('--list', '-l', action='store_true',
                               help='List available backups and exit')
@@ -476,20 +546,78 @@ def main():
                               help='Interactive backup selection')
     restore_parser.add_argument('--source', choices=['firefox', 'chrome'],
                               help='Filter backups by source')
-    restore_parser.add_argument('--firefox-profile', help='Firefox profile name')
-    restore_parser.add_argument('--chrome-profile', help='Chrome profile name')
     restore_parser.add_argument('--latest', action='store_true',
                               help='Restore from latest backup')
-    
-    # List profiles command
-    subparsers.add_parser('list-profiles', help='List available browser profiles')
-    
-    # List backups command
-    list_backups_parser = subparsers.add_parser('list-backups', help='List backups')
+
+
+def _add_list_profiles_parser(subparsers, help_text: str):
+    """Add the list-profiles command."""
+    subparsers.add_parser('list-profiles', help=help_text)
+
+
+def _add_list_backups_parser(subparsers, help_text: str):
+    """Add the list-backups command and its options."""
+    list_backups_parser = subparsers.add_parser('list-backups', help=help_text,
+                                                parents=[_paging_options()])
     list_backups_parser.add_argument('--source', choices=['firefox', 'chrome'],
                                     help='Filter by source')
+
+
+# Command name -> (help text, function adding its fully populated parser)
+_COMMANDS = {
+    'sync': ('Sync bookmarks', _add_sync_parser),
+    'merge': ('Merge bookmarks from both browsers', _add_merge_parser),
+    'backup': ('Backup bookmarks', _add_backup_parser),
+    'restore': ('Restore from backup', _add_restore_parser),
+    'list-profiles': ('List available browser profiles', _add_list_profiles_parser),
+    'list-backups': ('List backups', _add_list_backups_parser),
+}
+
+
+def _build_parser(command: Optional[str] = None) -> argparse.ArgumentParser:
+    """
+    Build the CLI argument parser.
+    
+    Every command is registered so top-level help lists them all, but only
+    the given command gets its options; the rest are bare stubs.
+    
+    Args:
+        command: Command about to be parsed (None to build no command options)
+        
+    Returns:
+        Argument parser
+    """
+    parser = argparse.ArgumentParser(
+        description="Sync bookmarks between Firefox and Chrome",
+        formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    
+    parser.add_argument('--interactive', '-i', action='store_true',
+                       help='Run in interactive mode')
+    parser.add_argument('--gui', action='store_true',
+                       help='Run GUI interface')
+    parser.add_argument('--config-wizard', action='store_true',
+                       help='Run configuration wizard')
+    
+    subparsers = parser.add_subparsers(dest='command', help='Command to execute')
+    for name, (help_text, add_parser) in _COMMANDS.items():
+        if name == command:
+            add_parser(subparsers, help_text)
+        else:
+            subparsers.add_parser(name, help=help_text)
+    
+    return parser
+
+
+def main():
+    """Main entry point."""
+    argv = sys.argv[1:]
+    # Top-level options are all flags, so the first bare word is the command;
+    # with none (e.g. plain --help) no command options need building
+    command = next((arg for arg in argv if not arg.startswith('-')), None)
+    parser = _build_parser(command)
     
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
     
     # Handle special modes
     if args.gui:
@@ -512,6 +640,7 @@ def main():
                 return 1
     
     if args.config_wizard:
+        from src.ui.interactive import interactive_config_wizard
         config = interactive_config_wizard()
         if config:
             save_config(config)
@@ -520,6 +649,8 @@ def main():
     
     if args.interactive and args.command == 'sync':
         # Interactive sync mode
+        from src.core.sync_engine import SyncEngine
+        from src.ui.interactive import interactive_sync
         try:
             sync_config = interactive_sync()
             engine = SyncEngine(
@@ -152,8 +152,7 @@ class BookmarkSyncGUI(QMainWindow):
                         logger.warning(f"Chrome SVG renderer is not valid: {chrome_svg}")
         except Exception as e:
             logger.warning(f"Could not load SVG icons: {e}")
-            import traceback
-            logger.debug(traceback.format_exc())
+            logger.debug("SVG icon load failure traceback:", exc_info=True)
 
     def _render_svg_to_pixmap(self, renderer: QSvgRenderer) -> QPixmap:
         """
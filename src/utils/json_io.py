@@ -0,0 +1,43 @@
+"""JSON encode/decode helpers, using orjson when it is installed."""
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """
+    Decode JSON from bytes or str.
+    
+    Args:
+        data: Raw JSON document
+        
+    Returns:
+        Decoded Python object
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any, indent: bool = True) -> bytes:
+    """
+    Encode an object as UTF-8 JSON bytes.
+    
+    Args:
+        obj: Object to encode
+        indent: Pretty-print with 2-space indentation
+        
+    Returns:
+        Encoded JSON document
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option)
+    return json.dumps(obj, indent=2 if indent else None, ensure_ascii=False).encode('utf-8')
@@ -5,11 +5,17 @@ import sys
 from pathlib import Path
 from datetime import datetime
 
+# Logger names that already have their handlers attached
+_configured = set()
+
 
 def setup_logger(name: str = "bookmark_sync", level: int = logging.INFO) -> logging.Logger:
     """
     Set up logger with file and console handlers.
     
+    Every module calls this at import time, so handlers are only created on
+    the first call for a given name; later calls return the cached logger.
+    
     Args:
         name: Logger name
         level: Logging level
@@ -18,6 +24,9 @@ def setup_logger(name: str = "bookmark_sync", level: int = logging.INFO) -> logg
         Configured logger instance
     """
     logger = logging.getLogger(name)
+    if name in _configured:
+        return logger
+    
     logger.setLevel(level)
     
     # Remove existing handlers
@@ -46,4 +55,5 @@ def setup_logger(name: str = "bookmark_sync", level: int = logging.INFO) -> logg
     file_handler.setFormatter(file_format)
     logger.addHandler(file_handler)
     
+    _configured.add(name)
     return logger
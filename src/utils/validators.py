@@ -1,17 +1,29 @@
 """Input validation utilities."""
 
-from urllib.parse import urlparse
+import re
+from urllib.parse import urlsplit
 from typing import Optional
 
 
-def is_valid_url(url: str) -> bool:
+# Matches URLs that urlsplit is certain to accept with a scheme and netloc:
+# an ASCII scheme, "://", then a printable-ASCII netloc without brackets.
+# Anything else (IPv6 literals, IDNs, stray whitespace...) takes the urlsplit path.
+_SIMPLE_URL_RE = re.compile(r"[A-Za-z][A-Za-z0-9+.\-]*://[^/?#\[\]\x00-\x20\x7f-\U0010ffff]+(?:[/?#]|\Z)")
+
+
+def is_valid_url(url: str, _simple_match=_SIMPLE_URL_RE.match) -> bool:
     """Validate URL format."""
     if not url or not isinstance(url, str):
         return False
     
+    if _simple_match(url):
+        return True
+    
     try:
-        result = urlparse(url)
-        return all([result.scheme, result.netloc])
+        # urlsplit yields the same scheme/netloc as urlparse without the extra
+        # ;params pass, and this runs once per bookmark on every read
+        result = urlsplit(url)
+        return bool(result.scheme and result.netloc)
     except Exception:
         return False
 
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""Regression tests for incremental sync change tracking (no real browsers needed)."""
+
+import sys
+import tempfile
+from pathlib import Path
+from datetime import datetime
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from src.browsers.chrome import ChromeAdapter
+from src.core.change_detector import ChangeDetector
+from src.core.merger import MergeStrategy
+from src.core.models import Bookmark, BookmarkFolder
+from src.core.sync_engine import SyncEngine, SyncDirection, SyncMode
+from src.core.sync_metadata import SyncMetadata
+
+
+class FakeFirefoxAdapter:
+    """In-memory stand-in for FirefoxAdapter that serves a fixed tree."""
+    
+    def __init__(self, profile_path: Path, tree: BookmarkFolder):
+        self.profile_path = profile_path
+        self.tree = tree
+    
+    def is_locked(self) -> bool:
+        return False
+    
+    def get_profile_path(self) -> Path:
+        return self.profile_path
+    
+    def read_bookmarks(self) -> BookmarkFolder:
+        return self.tree
+
+
+def make_tree(urls):
+    """Build a one-folder tree with a bookmark per URL and fixed timestamps."""
+    when = datetime(2024, 1, 1, 12, 0, 0)
+    folder = BookmarkFolder(name="Bookmarks Bar", date_added=when, date_modified=when)
+    for url in urls:
+        folder.add_child(Bookmark(title=url, url=url, date_added=when, date_modified=when))
+    root = BookmarkFolder(name="Firefox Bookmarks", date_added=when, date_modified=when)
+    root.add_child(folder)
+    return root
+
+
+def make_engine(tmp: Path, tree: BookmarkFolder) -> SyncEngine:
+    """Build an incremental Firefox → Chrome engine on temporary files."""
+    (tmp / "firefox").mkdir()
+    (tmp / "chrome").mkdir()
+    
+    chrome = ChromeAdapter.__new__(ChromeAdapter)
+    chrome.profile_name = None
+    chrome.profile_path = tmp / "chrome"
+    chrome.bookmarks_file = tmp / "chrome" / "Bookmarks"
+    chrome.is_locked = lambda: False
+    chrome.writes = 0
+    write = chrome.write_bookmarks
+    
+    def counting_write(written_tree):
+        chrome.writes += 1
+        return write(written_tree)
+    chrome.write_bookmarks = counting_write
+    
+    engine = SyncEngine.__new__(SyncEngine)
+    engine.firefox_adapter = FakeFirefoxAdapter(tmp / "firefox", tree)
+    engine.firefox_profile_name = "default"
+    engine.chrome_adapter = chrome
+    engine.chrome_profile_name = "Default"
+    engine.merge_strategy = MergeStrategy.KEEP_ALL
+    engine._merger = None
+    engine._backup_manager = None
+    engine.backup_before_sync = False
+    engine.sync_mode = SyncMode.INCREMENTAL
+    engine.change_detector = ChangeDetector()
+    engine.metadata = SyncMetadata(tmp / "sync_metadata.json")
+    engine.firefox_path = tmp / "firefox"
+    engine.chrome_path = tmp / "chrome"
+    return engine
+
+
+def test_deleted_bookmark_is_dropped_from_stored_hashes():
+    """After a deletion is synced, the next incremental sync has nothing to do."""
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = make_engine(Path(tmp), make_tree([
+            "https://a.example/", "https://b.example/", "https://c.example/"
+        ]))
+        
+        assert engine.sync(SyncDirection.FIREFOX_TO_CHROME)
+        assert engine.chrome_adapter.writes == 1
+        
+        # Delete a bookmark in the source and sync it
+        engine.firefox_adapter.tree = make_tree(["https://a.example/", "https://b.example/"])
+        assert engine.sync(SyncDirection.FIREFOX_TO_CHROME)
+        assert engine.chrome_adapter.writes == 2
+        
+        stored = engine.metadata.get_all_bookmark_hashes("chrome", "Default")
+        assert set(stored) == {"https://a.example/", "https://b.example/"}
+        
+        # Nothing changed since: no deletion is reported again, nothing is written
+        assert engine.sync(SyncDirection.FIREFOX_TO_CHROME)
+        assert engine.chrome_adapter.writes == 2
+        
+        # The stored state survives a reload from disk
+        reloaded = SyncMetadata(Path(tmp) / "sync_metadata.json")
+        assert reloaded.get_all_bookmark_hashes("chrome", "Default") == stored
+
+
+def main():
+    """Run all tests."""
+    tests = [test_deleted_bookmark_is_dropped_from_stored_hashes]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+            print(f"✓ {test.__name__}")
+        except AssertionError as e:
+            failed += 1
+            print(f"✗ {test.__name__}: {e}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())